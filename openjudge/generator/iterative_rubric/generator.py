@@ -22,7 +22,7 @@ This implementation is based on the paper:
 
 import asyncio
 from dataclasses import dataclass
-from typing import List, Union
+from typing import Callable, List, Union
 
 from loguru import logger
 
@@ -78,6 +78,9 @@ class IterativeRubricsGeneratorConfig(LLMGraderGeneratorConfig):
         batch_size: Number of eval cases to process per batch iteration.
                    Controls how many samples are processed in each batch.
                    Defaults to 10.
+        max_concurrency: Maximum number of samples generating rubrics at the same time.
+                        Bounds concurrent LLM requests during query-specific generation.
+                        None means no limit. Defaults to None.
         mcr_batch_size: Number of rubrics selected by MCR² per iteration.
                        Controls the selection size in smart sampling mode.
                        Defaults to 10.
@@ -108,6 +111,7 @@ class IterativeRubricsGeneratorConfig(LLMGraderGeneratorConfig):
 
     # Batch processing parameters
     batch_size: int = 10
+    max_concurrency: int | None = None
 
     # MCR² parameters
     mcr_batch_size: int = 10
@@ -186,6 +190,7 @@ class IterativeRubricsGenerator(LLMGraderGenerator):
     def __init__(
         self,
         config: Union[IterativePointwiseRubricsGeneratorConfig, IterativeListwiseRubricsGeneratorConfig],
+        on_sample_complete: Callable[[int, int], None] | None = None,
     ) -> None:
         """Initialize the rubrics generator with the provided configuration.
 
@@ -223,8 +228,13 @@ class IterativeRubricsGenerator(LLMGraderGenerator):
                 From IterativePointwiseRubricsGeneratorConfig (only for pointwise evaluation):
                 - min_score (int): Minimum score value for pointwise mode. Defaults to 0.
                 - max_score (int): Maximum score value for pointwise mode. Defaults to 1.
+            on_sample_complete (Callable[[int, int], None] | None):
+                Optional hook called after each training sample finishes query-specific
+                generation, with (completed_samples, dataset_size). In SMART_SAMPLING mode
+                samples may be revisited, so completed_samples can exceed dataset_size.
         """
         self.config = config
+        self.on_sample_complete = on_sample_complete
 
     async def generate(
         self,
@@ -387,6 +397,23 @@ class IterativeRubricsGenerator(LLMGraderGenerator):
 
         query_generator = QuerySpecificRubricGenerator(**generator_kwargs)
 
+        # Optionally bound how many samples talk to the LLM at the same time
+        semaphore = asyncio.Semaphore(self.config.max_concurrency) if self.config.max_concurrency else None
+
+        completed = 0
+
+        async def generate_for_sample(data_item: dict) -> dict:
+            nonlocal completed
+            if semaphore is None:
+                result = await query_generator.generate_iterative(data_item)
+            else:
+                async with semaphore:
+                    result = await query_generator.generate_iterative(data_item)
+            completed += 1
+            if self.on_sample_complete is not None:
+                self.on_sample_complete(completed, len(dataset))
+            return result
+
         # Automatically select sampling mode based on data size
         # <= 100 samples: all_samples, > 100 samples: smart_sampling
         sampling_mode = "all_samples" if len(dataset) <= 100 else "smart_sampling"
@@ -400,7 +427,7 @@ class IterativeRubricsGenerator(LLMGraderGenerator):
             all_coroutines = []
             for data_item in dataset:
                 all_coroutines.append(
-                    query_generator.generate_iterative(data_item),
+                    generate_for_sample(data_item),
                 )
 
             # Execute all coroutines concurrently
@@ -472,7 +499,7 @@ class IterativeRubricsGenerator(LLMGraderGenerator):
                 )
 
                 # Generate rubrics for batch concurrently
-                batch_coroutines = [query_generator.generate_iterative(data_item) for data_item in batch_data]
+                batch_coroutines = [generate_for_sample(data_item) for data_item in batch_data]
                 batch_results = await asyncio.gather(*batch_coroutines)
 
                 batch_rubrics = []
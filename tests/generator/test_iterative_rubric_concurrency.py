@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for concurrency and progress reporting in the Iterative Rubric Generator.
+
+Query-specific generation is replaced with a fake, so these tests need no LLM.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from openjudge.generator.iterative_rubric.generator import (
+    IterativePointwiseRubricsGeneratorConfig,
+    IterativeRubricsGenerator,
+)
+
+
+class FakeQueryGenerator:
+    """Stands in for QuerySpecificRubricGenerator and records peak concurrency."""
+
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def generate_iterative(self, data_item: dict) -> dict:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        # Yield a few times so other samples get the chance to start
+        for _ in range(3):
+            await asyncio.sleep(0)
+        cls.in_flight -= 1
+        return {"rubric_valid": True, "rubrics": [f"rubric for {data_item['query']}"]}
+
+
+@pytest.fixture
+def fake_query_generator():
+    """Patch query-specific generation with a fresh FakeQueryGenerator."""
+    FakeQueryGenerator.in_flight = 0
+    FakeQueryGenerator.peak = 0
+    with patch(
+        "openjudge.generator.iterative_rubric.generator.QuerySpecificRubricGenerator",
+        FakeQueryGenerator,
+    ):
+        yield FakeQueryGenerator
+
+
+def _dataset(size: int) -> list[dict]:
+    return [{"query": f"q{i}", "response": f"r{i}", "label_score": 1} for i in range(size)]
+
+
+@pytest.mark.unit
+class TestIterativeRubricConcurrency:
+    """Test cases for max_concurrency and on_sample_complete."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [1, 3])
+    async def test_max_concurrency_bounds_in_flight_samples(self, fake_query_generator, max_concurrency):
+        """Test that no more than max_concurrency samples generate at the same time."""
+        config = IterativePointwiseRubricsGeneratorConfig(grader_name="test", max_concurrency=max_concurrency)
+        generator = IterativeRubricsGenerator(config)
+
+        rubrics = await generator._generate_query_rubrics(_dataset(10))
+
+        assert len(rubrics) == 10
+        assert fake_query_generator.peak == max_concurrency
+
+    @pytest.mark.asyncio
+    async def test_no_max_concurrency_runs_all_samples_at_once(self, fake_query_generator):
+        """Test that all samples run concurrently when max_concurrency is None."""
+        config = IterativePointwiseRubricsGeneratorConfig(grader_name="test")
+        generator = IterativeRubricsGenerator(config)
+
+        await generator._generate_query_rubrics(_dataset(10))
+
+        assert fake_query_generator.peak == 10
+
+    @pytest.mark.asyncio
+    async def test_on_sample_complete_fires_once_per_sample(self, fake_query_generator):
+        """Test that the callback reports each finished sample with the dataset size."""
+        calls = []
+        config = IterativePointwiseRubricsGeneratorConfig(grader_name="test", max_concurrency=4)
+        generator = IterativeRubricsGenerator(
+            config, on_sample_complete=lambda done, total: calls.append((done, total))
+        )
+
+        await generator._generate_query_rubrics(_dataset(10))
+
+        assert calls == [(done, 10) for done in range(1, 11)]
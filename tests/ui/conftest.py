@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Make the OpenJudge Studio packages importable the way ``ui/app.py`` does."""
+
+import sys
+from pathlib import Path
+
+UI_DIR = Path(__file__).resolve().parents[2] / "ui"
+if str(UI_DIR) not in sys.path:
+    sys.path.insert(0, str(UI_DIR))
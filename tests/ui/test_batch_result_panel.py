@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the batch result panel's cached results frame."""
+
+import pytest
+from features.grader.components.batch.batch_result_panel import (
+    _results_digest,
+    _results_frame,
+)
+
+RESULTS_BY_INDEX = [
+    {"index": 0, "score": 0.9, "passed": True, "status": "success"},
+    {"index": 1, "score": 0.1, "passed": False, "status": "success"},
+]
+
+# The same task as written to results.json, in completion order
+RESULTS_BY_COMPLETION = list(reversed(RESULTS_BY_INDEX))
+
+
+@pytest.mark.unit
+class TestResultsFrame:
+    """Test cases for the results frame cache."""
+
+    def test_digest_depends_on_order(self):
+        """Test that the same results in another order get another digest."""
+        assert _results_digest(RESULTS_BY_INDEX) != _results_digest(RESULTS_BY_COMPLETION)
+
+    def test_frame_rows_map_back_to_their_records(self):
+        """Test that a reordered load of a task never reuses the other order's frame."""
+        _results_frame.clear()
+        for results in (RESULTS_BY_INDEX, RESULTS_BY_COMPLETION):
+            frame = _results_frame(_results_digest(results), results)
+            passed = frame[frame["passed"].eq(True).fillna(False)]
+
+            assert [results[pos] for pos in passed.index] == [RESULTS_BY_INDEX[0]]
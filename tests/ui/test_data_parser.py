@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the Auto Rubric CSV readers."""
+
+import pytest
+from features.auto_rubric.services.data_parser import DataParser
+
+pytest.importorskip("pyarrow")
+
+NULL_LIKE_CSV = b"query,response,label_score\nNA,null,1\nNone,N/A,2\n"
+
+# Large enough to span several of arrow's 1 MB parse blocks, within MAX_RECORDS
+MULTILINE_CSV = b"query,response,label_score\n" + b"".join(
+    b'"question %d\n%s","answer\nspanning\nlines",%d\n' % (i, b"x" * 8000, i % 5) for i in range(400)
+)
+
+RAGGED_CSV = b"query,response,label_score\nq1,r1,1\nq2,r2\n"
+
+
+@pytest.mark.unit
+class TestCsvReaders:
+    """The pyarrow reader must give the same records as the stdlib reader."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [NULL_LIKE_CSV, MULTILINE_CSV, RAGGED_CSV],
+        ids=["null-like-values", "multiline-cells", "ragged-row"],
+    )
+    def test_arrow_matches_stdlib(self, content):
+        """Test both readers on inputs where arrow's defaults used to differ."""
+        assert DataParser._read_csv_arrow(content) == DataParser._read_csv(content)
+
+    def test_null_like_values_are_kept(self):
+        """Test that only empty cells become None."""
+        data = DataParser._read_csv_arrow(NULL_LIKE_CSV)
+
+        assert data == [
+            {"query": "NA", "response": "null", "label_score": 1.0},
+            {"query": "None", "response": "N/A", "label_score": 2.0},
+        ]
+
+    def test_multiline_file_parses(self):
+        """Test that quoted newlines survive in files past arrow's block size."""
+        assert len(MULTILINE_CSV) > 1 << 20
+
+        result = DataParser().parse_file(MULTILINE_CSV, "data.csv")
+
+        assert result.success
+        assert result.data[0]["response"] == "answer\nspanning\nlines"
+
+    def test_ragged_row_is_padded(self):
+        """Test that a short row is padded instead of failing the upload."""
+        data = DataParser._read_csv_arrow(RAGGED_CSV)
+
+        assert data[1] == {"query": "q2", "response": "r2", "label_score": None}
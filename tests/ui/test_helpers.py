@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the shared background event loop helpers."""
+
+import asyncio
+import concurrent.futures
+from unittest.mock import patch
+
+import pytest
+from shared.utils import helpers
+
+
+@pytest.mark.unit
+class TestWaitAsync:
+    """Test cases for wait_async."""
+
+    def test_returns_the_coroutine_result(self):
+        """Test that wait_async runs the coroutine on the background loop."""
+
+        async def answer():
+            return 42
+
+        assert helpers.wait_async(answer()) == 42
+
+    def test_interrupted_wait_cancels_the_coroutine(self):
+        """Test that an interrupted script thread cancels the work it started."""
+        futures = []
+
+        def submit(coro):
+            futures.append(asyncio.run_coroutine_threadsafe(coro, helpers.get_background_loop()))
+            return futures[-1]
+
+        # Interrupt the wait the way a Streamlit rerun or stop would
+        with (
+            patch.object(helpers, "submit_async", submit),
+            patch.object(concurrent.futures.Future, "result", side_effect=KeyboardInterrupt),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                helpers.wait_async(asyncio.Event().wait())
+
+        assert futures[0].cancelled()
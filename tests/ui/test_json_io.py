@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the shared JSON helpers."""
+
+import numpy as np
+import pytest
+from features.grader.services.batch_history_manager import BatchHistoryManager
+from shared.utils import json_io
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(json_io, "orjson", None)
+    elif json_io.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.unit
+class TestDumpJson:
+    """Test cases for dump_json."""
+
+    def test_numpy_values_round_trip(self, json_backend):
+        """Test that numpy scalars and arrays serialize as plain values."""
+        record = {"score": np.float64(0.5), "count": np.int64(3), "flags": np.array([True, False])}
+
+        assert json_io.loads(json_io.dump_json(record)) == {"score": 0.5, "count": 3, "flags": [True, False]}
+
+    def test_batch_results_with_numpy_metadata_are_saved(self, json_backend, tmp_path):
+        """Test that grader metadata holding numpy values no longer fails a results save."""
+        manager = BatchHistoryManager(base_dir=tmp_path)
+        task_id = manager.generate_task_id()
+        manager.create_task_dir(task_id)
+        results = [{"index": 0, "score": np.float64(0.75), "metadata": {"votes": np.int32(2)}}]
+
+        assert manager.save_results(task_id, results)
+        assert manager.get_task_results(task_id) == [{"index": 0, "score": 0.75, "metadata": {"votes": 2}}]
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the Auto Rubric generation rate limiter."""
+
+import httpx
+import pytest
+from features.auto_rubric.services import rubric_generator_service
+from features.auto_rubric.services.rubric_generator_service import (
+    AsyncRateLimiter,
+    _estimate_tokens,
+    _RateLimitAwareClient,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the limiter with a fake clock instead of real time."""
+    fake = FakeClock()
+    monkeypatch.setattr(rubric_generator_service.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rubric_generator_service.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.unit
+class TestAsyncRateLimiter:
+    """Test cases for the AsyncRateLimiter token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_budget_does_not_wait(self, clock):
+        """Test that calls within both budgets go straight through."""
+        limiter = AsyncRateLimiter(requests_per_minute=3, tokens_per_minute=300)
+
+        for _ in range(3):
+            await limiter.acquire(100)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_request_budget_waits_for_refill(self, clock):
+        """Test that an exhausted request bucket waits one refill interval."""
+        limiter = AsyncRateLimiter(requests_per_minute=60, tokens_per_minute=None)
+        for _ in range(60):
+            await limiter.acquire()
+
+        await limiter.acquire()
+
+        assert sum(clock.sleeps) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_token_budget_waits_for_refill(self, clock):
+        """Test that an exhausted token bucket waits until enough tokens refill."""
+        limiter = AsyncRateLimiter(requests_per_minute=None, tokens_per_minute=600)
+        await limiter.acquire(600)
+
+        await limiter.acquire(100)
+
+        assert sum(clock.sleeps) == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_capped_to_the_budget(self, clock):
+        """Test that a prompt larger than the whole budget still goes through."""
+        limiter = AsyncRateLimiter(requests_per_minute=None, tokens_per_minute=100)
+
+        await limiter.acquire(1000)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_no_limits_never_waits(self, clock):
+        """Test that a limiter without budgets never sleeps."""
+        limiter = AsyncRateLimiter(requests_per_minute=None, tokens_per_minute=None)
+
+        for _ in range(100):
+            await limiter.acquire(10_000)
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_backoff_halves_remaining_budget(self, clock):
+        """Test that backoff drains the buckets so the next call waits."""
+        limiter = AsyncRateLimiter(requests_per_minute=2, tokens_per_minute=None)
+        await limiter.acquire()
+
+        limiter.backoff()
+        await limiter.acquire()
+
+        assert sum(clock.sleeps) == pytest.approx(15.0)
+
+
+@pytest.mark.unit
+class TestEstimateTokens:
+    """Test cases for the prompt token estimate."""
+
+    def test_english_is_not_undercounted(self):
+        """Test that English text is counted at least one token per four characters."""
+        text = "a" * 400
+
+        assert _estimate_tokens([{"role": "user", "content": text}]) >= 100
+
+    def test_cjk_counts_a_token_per_character(self):
+        """Test that CJK text is counted at least one token per character."""
+        text = "评估回答的准确性" * 10
+
+        assert _estimate_tokens([{"role": "user", "content": text}]) >= len(text)
+
+
+@pytest.mark.unit
+class TestRateLimitAwareClient:
+    """Test cases for the SDK retry policy of rate-limited models."""
+
+    @pytest.mark.parametrize("status_code, should_retry", [(429, False), (408, True), (500, True), (503, True)])
+    def test_only_rate_limits_skip_sdk_retries(self, status_code, should_retry):
+        """Test that 429s go to the limiter while other transient errors keep SDK retries."""
+        client = _RateLimitAwareClient(api_key="test-key", base_url="https://api.example.com/v1")
+
+        assert client._should_retry(httpx.Response(status_code)) is should_retry
@@ -10,7 +10,10 @@ from features.auto_rubric.components.iterative_config_panel import (
     render_iterative_config_panel,
     validate_iterative_config,
 )
-from features.auto_rubric.components.result_panel import render_result_panel
+from features.auto_rubric.components.result_panel import (
+    render_empty_result_panel,
+    render_result_panel,
+)
 from features.auto_rubric.components.rubric_tester import (
     render_test_panel,
     render_test_section_compact,
@@ -29,6 +32,7 @@ __all__ = [
     "validate_iterative_config",
     "render_data_upload_panel",
     "render_result_panel",
+    "render_empty_result_panel",
     "render_history_panel",
     "render_task_detail",
     "render_test_panel",
@@ -8,7 +8,7 @@ import html
 from typing import Any
 
 import streamlit as st
-from features.auto_rubric.services.data_parser import DataParser
+from features.auto_rubric.services.data_parser import get_data_parser
 from shared.i18n import t
 
 
@@ -86,7 +86,7 @@ def render_data_upload_panel(mode: str = "pointwise") -> dict[str, Any]:
 
     if uploaded_file is not None:
         # Parse the file
-        parser = DataParser()
+        parser = get_data_parser()
         content = uploaded_file.read()
 
         with st.spinner(t("rubric.upload.parsing")):
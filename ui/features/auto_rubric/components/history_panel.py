@@ -11,7 +11,7 @@ from typing import Any, Callable
 
 import streamlit as st
 from features.auto_rubric.services.export_service import ExportService
-from features.auto_rubric.services.history_manager import HistoryManager
+from features.auto_rubric.services.history_manager import get_history_manager
 from shared.i18n import t
 
 
@@ -54,7 +54,7 @@ def render_history_panel(
     )
 
     # Load history
-    history_manager = HistoryManager()
+    history_manager = get_history_manager()
     tasks = history_manager.list_tasks(limit=limit)
 
     if not tasks:
@@ -188,7 +188,7 @@ def _render_task_card(
 
 def _render_export_modal(task_id: str) -> None:
     """Render export options for a task."""
-    history_manager = HistoryManager()
+    history_manager = get_history_manager()
     details = history_manager.get_task_details(task_id)
 
     if not details:
@@ -258,7 +258,7 @@ def render_task_detail(
         task_id: Task identifier.
         on_back: Callback for back button.
     """
-    history_manager = HistoryManager()
+    history_manager = get_history_manager()
     details = history_manager.get_task_details(task_id)
 
     if not details:
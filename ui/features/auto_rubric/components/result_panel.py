@@ -8,12 +8,13 @@ Displays:
 """
 
 import html
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
 from features.auto_rubric.components.rubric_tester import render_test_section_compact
 from features.auto_rubric.services.export_service import ExportService
-from shared.i18n import t
+from shared.i18n import get_ui_language, t
 
 from openjudge.graders.llm_grader import LLMGrader
 
@@ -30,10 +31,16 @@ def _escape_html(text: str) -> str:
     return html.escape(str(text)) if text else ""
 
 
-def render_empty_state() -> None:
-    """Render the empty state when no grader has been generated."""
-    st.markdown(
-        f"""
+_RESULT_TITLE_HTML = """
+        <div style="
+            font-weight: 600;
+            color: #F1F5F9;
+            font-size: 1.1rem;
+            margin-bottom: 1rem;
+        ">{title}</div>
+        """
+
+_EMPTY_STATE_HTML = """
         <div style="
             background: rgba(30, 41, 59, 0.5);
             border: 1px dashed #475569;
@@ -48,23 +55,46 @@ def render_empty_state() -> None:
                 font-weight: 600;
                 color: #F1F5F9;
                 margin-bottom: 0.5rem;
-            ">{t('rubric.result.empty_title')}</div>
+            ">{title}</div>
             <div style="color: #94A3B8; font-size: 0.9rem;">
-                {t('rubric.result.empty_desc')}
+                {desc}
             </div>
             <div style="
                 color: #6366F1;
                 font-size: 0.85rem;
                 margin-top: 1rem;
             ">
-                💡 {t('rubric.result.empty_tip')}
+                💡 {tip}
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
+
+
+def _empty_state_html() -> str:
+    """Build the empty state HTML in the current UI language."""
+    return _EMPTY_STATE_HTML.format(
+        title=t("rubric.result.empty_title"),
+        desc=t("rubric.result.empty_desc"),
+        tip=t("rubric.result.empty_tip"),
     )
 
 
+@lru_cache(maxsize=8)
+def _empty_result_panel_html(lang: str) -> str:
+    """Build the panel title plus empty state HTML, cached per UI language."""
+    return _RESULT_TITLE_HTML.format(title=t("rubric.result.title")) + _empty_state_html()
+
+
+def render_empty_state() -> None:
+    """Render the empty state when no grader has been generated."""
+    st.markdown(_empty_state_html(), unsafe_allow_html=True)
+
+
+def render_empty_result_panel() -> None:
+    """Render the result panel before any generation as a single markdown element."""
+    st.markdown(_empty_result_panel_html(get_ui_language()), unsafe_allow_html=True)
+
+
 def render_grader_info(config: dict[str, Any]) -> None:
     """Render grader information card.
 
@@ -211,17 +241,7 @@ def render_result_panel(
         config: Grader configuration dictionary.
         grader: The generated LLMGrader instance for testing.
     """
-    st.markdown(
-        f"""
-        <div style="
-            font-weight: 600;
-            color: #F1F5F9;
-            font-size: 1.1rem;
-            margin-bottom: 1rem;
-        ">{t('rubric.result.title')}</div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_RESULT_TITLE_HTML.format(title=t("rubric.result.title")), unsafe_allow_html=True)
 
     # If no result at all, show empty state
     if result is None:
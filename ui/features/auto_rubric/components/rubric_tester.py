@@ -10,13 +10,16 @@ from typing import Any
 
 import streamlit as st
 from features.auto_rubric.services.rubric_generator_service import (
-    RubricGeneratorService,
+    get_rubric_generator_service,
 )
 from shared.i18n import t
-from shared.utils.helpers import run_async
+from shared.utils.helpers import wait_async
 
 from openjudge.graders.llm_grader import LLMGrader
 
+# Rank badge colors: first place, second place, and everything below
+_BADGE_COLORS = ("#22C55E", "#6366F1", "#94A3B8")
+
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters."""
@@ -198,8 +201,8 @@ def _run_test_pointwise(grader: LLMGrader, query: str, response: str) -> None:
 
     with st.spinner(t("rubric.test.running")):
         try:
-            service = RubricGeneratorService()
-            result = run_async(service.test_grader(grader, query, response))
+            service = get_rubric_generator_service()
+            result = wait_async(service.test_grader(grader, query, response))
             st.session_state["rubric_test_result"] = result
         except Exception as e:
             st.session_state["rubric_test_result"] = {
@@ -225,8 +228,8 @@ def _run_test_listwise(grader: LLMGrader, query: str, responses: list[str]) -> N
 
     with st.spinner(t("rubric.test.running")):
         try:
-            service = RubricGeneratorService()
-            result = run_async(service.test_grader_listwise(grader, query, responses))
+            service = get_rubric_generator_service()
+            result = wait_async(service.test_grader_listwise(grader, query, responses))
             st.session_state["rubric_test_result"] = result
         except Exception as e:
             st.session_state["rubric_test_result"] = {
@@ -372,7 +375,7 @@ def _render_listwise_result(result: dict[str, Any]) -> None:
         # Display ranking with badges
         rank_html = ""
         for i, r in enumerate(rank):
-            badge_color = "#22C55E" if i == 0 else "#6366F1" if i == 1 else "#94A3B8"
+            badge_color = _BADGE_COLORS[min(i, 2)]
             rank_html += f"""
                 <div style="
                     background: {badge_color}20;
@@ -465,8 +468,8 @@ def render_test_section_compact(
             ):
                 with st.spinner(t("rubric.test.running")):
                     try:
-                        service = RubricGeneratorService()
-                        result = run_async(service.test_grader_listwise(grader, test_query, responses))
+                        service = get_rubric_generator_service()
+                        result = wait_async(service.test_grader_listwise(grader, test_query, responses))
                         st.session_state["rubric_test_result"] = result
                     except Exception as e:
                         st.session_state["rubric_test_result"] = {
@@ -490,8 +493,8 @@ def render_test_section_compact(
             ):
                 with st.spinner(t("rubric.test.running")):
                     try:
-                        service = RubricGeneratorService()
-                        result = run_async(service.test_grader(grader, test_query, test_response))
+                        service = get_rubric_generator_service()
+                        result = wait_async(service.test_grader(grader, test_query, test_response))
                         st.session_state["rubric_test_result"] = result
                     except Exception as e:
                         st.session_state["rubric_test_result"] = {
@@ -4,42 +4,106 @@
 Provides configuration for:
 - LLM API settings (provider, key, model)
 - Generation settings (language, evaluation mode, score range)
-- Advanced settings (max retries)
+- Advanced settings (max retries, rate limits)
 """
 
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
 from shared.constants import DEFAULT_API_ENDPOINTS, DEFAULT_MODELS
-from shared.i18n import t
+from shared.i18n import get_ui_language, t
+
+# Widget / session state keys
+STATE_API_PROVIDER = "rubric_api_provider"
+STATE_CUSTOM_ENDPOINT = "rubric_custom_endpoint"
+STATE_API_KEY = "rubric_api_key"
+STATE_MODEL_VALUE = "rubric_model_value"
+STATE_CUSTOM_MODEL = "rubric_custom_model"
+STATE_LANGUAGE_VALUE = "rubric_language_value"
+STATE_EVAL_MODE_VALUE = "rubric_eval_mode_value"
+STATE_MIN_SCORE = "rubric_min_score"
+STATE_MAX_SCORE = "rubric_max_score"
+STATE_MAX_RETRIES = "rubric_max_retries"
+STATE_REQUESTS_PER_MINUTE = "rubric_requests_per_minute"
+STATE_TOKENS_PER_MINUTE = "rubric_tokens_per_minute"
+
+# Selectbox options are static, so build them once at import instead of per rerun
+_PROVIDER_OPTIONS = tuple(DEFAULT_API_ENDPOINTS)
+
+# Stable value for the custom model option to survive UI language switch
+_CUSTOM_VALUE = "_custom_"
+_MODEL_OPTIONS = (*DEFAULT_MODELS, _CUSTOM_VALUE)
+
+# Generation language - stable keys to survive UI language switch
+_LANGUAGE_VALUES = ("EN", "ZH")
+_LANGUAGE_LABELS = {"EN": "English", "ZH": "中文"}
+
+# Evaluation mode - stable values to survive UI language switch
+_MODE_VALUES = ("pointwise", "listwise")
+
+# Placeholder (min_score, max_score) for listwise mode, where the range is not used
+_LISTWISE_SCORES = (0, 1)
+
+# Every widget key read by this module; the sidebar config is a pure function of these
+_TRACKED_KEYS = (
+    STATE_API_PROVIDER,
+    STATE_CUSTOM_ENDPOINT,
+    STATE_API_KEY,
+    STATE_MODEL_VALUE,
+    STATE_CUSTOM_MODEL,
+    STATE_LANGUAGE_VALUE,
+    STATE_EVAL_MODE_VALUE,
+    STATE_MIN_SCORE,
+    STATE_MAX_SCORE,
+    STATE_MAX_RETRIES,
+    STATE_REQUESTS_PER_MINUTE,
+    STATE_TOKENS_PER_MINUTE,
+)
+
+# Session state keys for the cached sidebar config
+_SIDEBAR_FP_KEY = "_rubric_sidebar_fp"
+_SIDEBAR_CACHE_KEY = "_rubric_sidebar_cache"
+
+# HTML templates for translated labels rendered via st.markdown
+_SECTION_HEADER_HTML = '<div class="section-header">{}</div>'
+_SCORE_RANGE_HTML = '<div style="font-size: 0.85rem; color: #94A3B8; margin-bottom: 0.25rem;">{}</div>'
+_KEY_CONFIGURED_HTML = '<div class="status-badge status-pass">{}</div>'
+_KEY_REQUIRED_HTML = '<div class="status-badge status-warning">{}</div>'
+
+
+@lru_cache(maxsize=64)
+def _label_html(lang: str, template: str, key: str) -> str:
+    """Build the HTML for a translated label, cached per UI language."""
+    return template.format(t(key))
 
 
 def _render_llm_config(config: dict[str, Any]) -> None:
     """Render LLM configuration section."""
     st.markdown(
-        f'<div class="section-header">{t("rubric.sidebar.llm_config")}</div>',
+        _label_html(get_ui_language(), _SECTION_HEADER_HTML, "rubric.sidebar.llm_config"),
         unsafe_allow_html=True,
     )
 
     # API Provider selection
-    provider_options = list(DEFAULT_API_ENDPOINTS.keys())
-    if "rubric_api_provider" not in st.session_state:
-        st.session_state["rubric_api_provider"] = provider_options[0]
+    st.session_state.setdefault(STATE_API_PROVIDER, _PROVIDER_OPTIONS[0])
 
     provider = st.selectbox(
         t("api.provider"),
-        options=provider_options,
+        options=_PROVIDER_OPTIONS,
         help=t("rubric.sidebar.provider_help"),
-        key="rubric_api_provider",
+        key=STATE_API_PROVIDER,
     )
 
-    # Custom endpoint input (only for Custom provider)
+    # Custom endpoint input (only for Custom provider). The slot is always
+    # reserved so toggling the provider only fills or clears it.
+    endpoint_slot = st.empty()
     if provider == "Custom":
-        api_endpoint = st.text_input(
+        api_endpoint = endpoint_slot.text_input(
             t("api.custom_endpoint"),
             placeholder=t("api.custom_endpoint_placeholder"),
             help=t("api.custom_endpoint_help"),
-            key="rubric_custom_endpoint",
+            key=STATE_CUSTOM_ENDPOINT,
         )
     else:
         api_endpoint = DEFAULT_API_ENDPOINTS[provider]
@@ -50,123 +114,126 @@ def _render_llm_config(config: dict[str, Any]) -> None:
         type="password",
         placeholder=t("api.key_placeholder"),
         help=t("rubric.sidebar.api_key_help"),
-        key="rubric_api_key",
+        key=STATE_API_KEY,
     )
 
+    # API key status as a single lightweight HTML node instead of an alert widget
+    status_slot = st.empty()
     if api_key:
-        st.success(t("api.key_configured"))
+        status_html = _label_html(get_ui_language(), _KEY_CONFIGURED_HTML, "api.key_configured")
     else:
-        st.warning(t("api.key_required"))
+        status_html = _label_html(get_ui_language(), _KEY_REQUIRED_HTML, "api.key_required")
+    status_slot.markdown(status_html, unsafe_allow_html=True)
 
-    # Model selection - use stable value for custom option to survive UI language switch
-    CUSTOM_VALUE = "_custom_"
-    model_options = DEFAULT_MODELS + [CUSTOM_VALUE]
-
-    def format_model_option(x: str) -> str:
-        return t("model.custom") if x == CUSTOM_VALUE else x
+    # Model selection - labels are a plain dict so format_func is a C-level lookup
+    model_labels = {model: model for model in DEFAULT_MODELS}
+    model_labels[_CUSTOM_VALUE] = t("model.custom")
 
     # Initialize default value in session state if not exists
-    if "rubric_model_value" not in st.session_state:
-        st.session_state["rubric_model_value"] = DEFAULT_MODELS[0] if DEFAULT_MODELS else CUSTOM_VALUE
+    st.session_state.setdefault(STATE_MODEL_VALUE, _MODEL_OPTIONS[0])
 
     model_option = st.selectbox(
         t("model.select"),
-        options=model_options,
-        format_func=format_model_option,
+        options=_MODEL_OPTIONS,
+        format_func=model_labels.__getitem__,
         help=t("rubric.sidebar.model_help"),
-        key="rubric_model_value",
+        key=STATE_MODEL_VALUE,
     )
 
-    if model_option == CUSTOM_VALUE:
-        model_name = st.text_input(
+    custom_model_slot = st.empty()
+    if model_option == _CUSTOM_VALUE:
+        model_name = custom_model_slot.text_input(
             t("model.custom_input"),
             placeholder=t("model.custom_placeholder"),
-            key="rubric_custom_model",
+            key=STATE_CUSTOM_MODEL,
         )
     else:
         model_name = model_option
 
-    config["api_endpoint"] = api_endpoint
-    config["api_key"] = api_key
-    config["model_name"] = model_name
+    config.update(
+        {
+            "api_endpoint": api_endpoint,
+            "api_key": api_key,
+            "model_name": model_name,
+        }
+    )
 
 
 def _render_generation_settings(config: dict[str, Any]) -> None:
     """Render generation settings section."""
     st.markdown(
-        f'<div class="section-header">{t("rubric.sidebar.gen_settings")}</div>',
+        _label_html(get_ui_language(), _SECTION_HEADER_HTML, "rubric.sidebar.gen_settings"),
         unsafe_allow_html=True,
     )
 
-    # Language selection - use stable keys to survive UI language switch
-    language_values = ["EN", "ZH"]
-    language_labels = {"EN": "English", "ZH": "中文"}
-
-    # Initialize default value in session state if not exists
-    if "rubric_language_value" not in st.session_state:
-        st.session_state["rubric_language_value"] = "EN"
+    # Language selection - initialize default value in session state if not exists
+    st.session_state.setdefault(STATE_LANGUAGE_VALUE, "EN")
 
     language = st.selectbox(
         t("rubric.sidebar.language"),
-        options=language_values,
-        format_func=lambda x: language_labels.get(x, x),
+        options=_LANGUAGE_VALUES,
+        format_func=_LANGUAGE_LABELS.__getitem__,
         help=t("rubric.sidebar.language_help"),
-        key="rubric_language_value",
+        key=STATE_LANGUAGE_VALUE,
     )
 
-    # Evaluation mode - use stable values to survive UI language switch
-    mode_values = ["pointwise", "listwise"]
+    # Evaluation mode
     mode_labels = {
         "pointwise": t("rubric.sidebar.pointwise"),
         "listwise": t("rubric.sidebar.listwise"),
     }
 
     # Initialize default value in session state if not exists
-    if "rubric_eval_mode_value" not in st.session_state:
-        st.session_state["rubric_eval_mode_value"] = "pointwise"
+    st.session_state.setdefault(STATE_EVAL_MODE_VALUE, "pointwise")
 
     grader_mode = st.selectbox(
         t("rubric.sidebar.eval_mode"),
-        options=mode_values,
-        format_func=lambda x: mode_labels.get(x, x),
+        options=_MODE_VALUES,
+        format_func=mode_labels.__getitem__,
         help=t("rubric.sidebar.eval_mode_help"),
-        key="rubric_eval_mode_value",
+        key=STATE_EVAL_MODE_VALUE,
     )
 
-    # Score range (only for pointwise mode)
+    # Score range (only for pointwise mode). The slot is always reserved so
+    # switching modes fills or clears it in place.
+    score_slot = st.empty()
     if grader_mode == "pointwise":
-        st.markdown(
-            f'<div style="font-size: 0.85rem; color: #94A3B8; margin-bottom: 0.25rem;">'
-            f'{t("rubric.sidebar.score_range")}</div>',
-            unsafe_allow_html=True,
-        )
-        col1, col2 = st.columns(2)
-        with col1:
-            min_score = st.number_input(
-                t("rubric.sidebar.min_score"),
-                min_value=0,
-                max_value=100,
-                value=0,
-                step=1,
-                key="rubric_min_score",
-            )
-        with col2:
-            max_score = st.number_input(
-                t("rubric.sidebar.max_score"),
-                min_value=1,
-                max_value=100,
-                value=5,
-                step=1,
-                key="rubric_max_score",
+        with score_slot.container():
+            st.markdown(
+                _label_html(get_ui_language(), _SCORE_RANGE_HTML, "rubric.sidebar.score_range"),
+                unsafe_allow_html=True,
             )
+            col1, col2 = st.columns(2)
+            with col1:
+                min_score = st.number_input(
+                    t("rubric.sidebar.min_score"),
+                    min_value=0,
+                    max_value=100,
+                    value=0,
+                    step=1,
+                    key=STATE_MIN_SCORE,
+                )
+            with col2:
+                max_score = st.number_input(
+                    t("rubric.sidebar.max_score"),
+                    min_value=1,
+                    max_value=100,
+                    value=5,
+                    step=1,
+                    key=STATE_MAX_SCORE,
+                )
     else:
-        min_score = 0
-        max_score = 1  # Not used for listwise
-
-    config["language"] = language
-    config["grader_mode"] = grader_mode
-    config["min_score"] = min_score
-    config["max_score"] = max_score
+        score_slot.empty()
+        min_score, max_score = _LISTWISE_SCORES
+
+    config.update(
+        {
+            "language": language,
+            "grader_mode": grader_mode,
+            "min_score": min_score,
+            "max_score": max_score,
+        }
+    )
 
 
 def _render_advanced_settings(config: dict[str, Any]) -> None:
@@ -179,9 +246,32 @@ def _render_advanced_settings(config: dict[str, Any]) -> None:
             value=3,
             step=1,
             help=t("rubric.sidebar.max_retries_help"),
-            key="rubric_max_retries",
+            key=STATE_MAX_RETRIES,
+        )
+        # 0 leaves the limit off
+        requests_per_minute = st.number_input(
+            t("rubric.sidebar.requests_per_minute"),
+            min_value=0,
+            value=0,
+            step=100,
+            help=t("rubric.sidebar.requests_per_minute_help"),
+            key=STATE_REQUESTS_PER_MINUTE,
+        )
+        tokens_per_minute = st.number_input(
+            t("rubric.sidebar.tokens_per_minute"),
+            min_value=0,
+            value=0,
+            step=10000,
+            help=t("rubric.sidebar.tokens_per_minute_help"),
+            key=STATE_TOKENS_PER_MINUTE,
+        )
+        config.update(
+            {
+                "max_retries": max_retries,
+                "requests_per_minute": requests_per_minute or None,
+                "tokens_per_minute": tokens_per_minute or None,
+            }
         )
-        config["max_retries"] = max_retries
 
 
 def render_rubric_sidebar() -> dict[str, Any]:
@@ -197,6 +287,8 @@ def render_rubric_sidebar() -> dict[str, Any]:
         - min_score: Minimum score (pointwise only)
         - max_score: Maximum score (pointwise only)
         - max_retries: Maximum retry attempts
+        - requests_per_minute: Request rate limit, or None for no limit
+        - tokens_per_minute: Estimated token rate limit, or None for no limit
     """
     config: dict[str, Any] = {}
 
@@ -204,4 +296,12 @@ def render_rubric_sidebar() -> dict[str, Any]:
     _render_generation_settings(config)
     _render_advanced_settings(config)
 
+    # Reuse the previous dict when no sidebar widget changed, so reruns driven by
+    # main-panel widgets hand the same config object downstream
+    fp = tuple(st.session_state.get(k) for k in _TRACKED_KEYS)
+    if st.session_state.get(_SIDEBAR_FP_KEY) == fp:
+        return st.session_state[_SIDEBAR_CACHE_KEY]
+
+    st.session_state[_SIDEBAR_FP_KEY] = fp
+    st.session_state[_SIDEBAR_CACHE_KEY] = config
     return config
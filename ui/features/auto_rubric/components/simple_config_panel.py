@@ -13,6 +13,26 @@ from typing import Any
 import streamlit as st
 from shared.i18n import t
 
+# Widget / session state keys
+STATE_GRADER_NAME = "rubric_grader_name"
+STATE_TASK_DESCRIPTION = "rubric_task_description"
+STATE_SCENARIO = "rubric_scenario"
+STATE_SAMPLE_QUERIES = "rubric_sample_queries"
+
+# Session state key for the memoized (text, parsed queries) pair
+_SAMPLE_QUERIES_CACHE_KEY = "_rubric_sample_queries_cache"
+
+# Session state key for the memoized (sidebar config, panel fields, config) triple
+_CONFIG_CACHE_KEY = "_rubric_simple_config_cache"
+
+# Required fields and their validation error keys, checked in order
+_REQUIRED_FIELDS = (
+    ("grader_name", "rubric.validation.name_required"),
+    ("task_description", "rubric.validation.task_required"),
+    ("api_key", "rubric.validation.api_key_required"),
+    ("model_name", "rubric.validation.model_required"),
+)
+
 
 def render_simple_config_panel(sidebar_config: dict[str, Any]) -> dict[str, Any]:
     """Render the Simple Rubric configuration panel.
@@ -28,15 +48,13 @@ def render_simple_config_panel(sidebar_config: dict[str, Any]) -> dict[str, Any]
         - sample_queries: Optional list of sample queries
         - All sidebar config values
     """
-    config: dict[str, Any] = {}
-    config.update(sidebar_config)
 
     # Grader Name
     grader_name = st.text_input(
         t("rubric.config.grader_name"),
         placeholder=t("rubric.config.grader_name_placeholder"),
         help=t("rubric.config.grader_name_help"),
-        key="rubric_grader_name",
+        key=STATE_GRADER_NAME,
     )
 
     # Task Description (required)
@@ -45,7 +63,7 @@ def render_simple_config_panel(sidebar_config: dict[str, Any]) -> dict[str, Any]
         placeholder=t("rubric.config.task_description_placeholder"),
         height=150,
         help=t("rubric.config.task_description_help"),
-        key="rubric_task_description",
+        key=STATE_TASK_DESCRIPTION,
     )
 
     # Usage Scenario (optional)
@@ -53,7 +71,7 @@ def render_simple_config_panel(sidebar_config: dict[str, Any]) -> dict[str, Any]
         t("rubric.config.scenario"),
         placeholder=t("rubric.config.scenario_placeholder"),
         help=t("rubric.config.scenario_help"),
-        key="rubric_scenario",
+        key=STATE_SCENARIO,
     )
 
     # Sample Queries (optional)
@@ -62,19 +80,36 @@ def render_simple_config_panel(sidebar_config: dict[str, Any]) -> dict[str, Any]
         placeholder=t("rubric.config.sample_queries_placeholder"),
         height=100,
         help=t("rubric.config.sample_queries_help"),
-        key="rubric_sample_queries",
+        key=STATE_SAMPLE_QUERIES,
     )
 
-    # Parse sample queries (one per line)
-    sample_queries = None
-    if sample_queries_text.strip():
-        sample_queries = [q.strip() for q in sample_queries_text.strip().split("\n") if q.strip()]
+    # Reuse the previous config when neither the sidebar config object nor any
+    # panel field changed since the last rerun
+    fields = (grader_name, task_description, scenario, sample_queries_text)
+    cached_config = st.session_state.get(_CONFIG_CACHE_KEY)
+    if cached_config is not None and cached_config[0] is sidebar_config and cached_config[1] == fields:
+        return cached_config[2]
+
+    # Parse sample queries (one per line), reusing the last result if the text is unchanged
+    cached = st.session_state.get(_SAMPLE_QUERIES_CACHE_KEY)
+    if cached is not None and cached[0] == sample_queries_text:
+        sample_queries = cached[1]
+    else:
+        sample_queries = list(filter(None, map(str.strip, sample_queries_text.splitlines()))) or None
+        st.session_state[_SAMPLE_QUERIES_CACHE_KEY] = (sample_queries_text, sample_queries)
 
-    config["grader_name"] = grader_name
-    config["task_description"] = task_description
-    config["scenario"] = scenario if scenario else None
-    config["sample_queries"] = sample_queries
+    config: dict[str, Any] = {}
+    config.update(sidebar_config)
+    config.update(
+        {
+            "grader_name": grader_name,
+            "task_description": task_description,
+            "scenario": scenario if scenario else None,
+            "sample_queries": sample_queries,
+        }
+    )
 
+    st.session_state[_CONFIG_CACHE_KEY] = (sidebar_config, fields, config)
     return config
 
 
@@ -88,16 +123,8 @@ def validate_simple_config(config: dict[str, Any]) -> tuple[bool, str]:
         Tuple of (is_valid, error_message).
         If valid, error_message is empty string.
     """
-    if not config.get("grader_name", "").strip():
-        return False, t("rubric.validation.name_required")
-
-    if not config.get("task_description", "").strip():
-        return False, t("rubric.validation.task_required")
-
-    if not config.get("api_key", "").strip():
-        return False, t("rubric.validation.api_key_required")
-
-    if not config.get("model_name", "").strip():
-        return False, t("rubric.validation.model_required")
+    for field, error_key in _REQUIRED_FIELDS:
+        if not str(config.get(field) or "").strip():
+            return False, t(error_key)
 
     return True, ""
@@ -6,35 +6,193 @@ Phase 2: Iterative Rubric mode (data-driven from labeled data)
          + History management
 """
 
-from typing import Any
+import concurrent.futures
+import dataclasses
+import hashlib
+import queue
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
 import streamlit as st
 from core.base_feature import BaseFeature
-from features.auto_rubric.components.history_panel import (
-    render_history_panel,
-    render_task_detail,
-)
-from features.auto_rubric.components.iterative_config_panel import (
-    render_iterative_config_panel,
-    validate_iterative_config,
-)
-from features.auto_rubric.components.result_panel import render_result_panel
-from features.auto_rubric.components.sidebar import render_rubric_sidebar
-from features.auto_rubric.components.simple_config_panel import (
-    render_simple_config_panel,
-    validate_simple_config,
-)
-from features.auto_rubric.services.history_manager import HistoryManager
-from features.auto_rubric.services.rubric_generator_service import (
-    IterativeRubricConfig,
-    RubricGeneratorService,
-    SimpleRubricConfig,
-)
-from shared.i18n import t
-from shared.utils.helpers import run_async
-
-from openjudge.graders.schema import GraderMode
-from openjudge.models.schema.prompt_template import LanguageEnum
+from shared.i18n import get_ui_language, t
+from shared.utils.helpers import submit_async, wait_async
+from shared.utils.json_io import dump_json
+
+# Panels and services pull in the openjudge generator/grader stack, so they are
+# imported inside the methods that use them rather than when the app starts.
+if TYPE_CHECKING:
+    from features.auto_rubric.services.history_manager import HistoryManager
+    from features.auto_rubric.services.rubric_generator_service import GenerationResult
+
+# Main content views, in tab order
+_TAB_VALUES = ("new", "history", "help")
+
+
+@lru_cache(maxsize=8)
+def _tab_labels(lang: str) -> dict[str, str]:
+    """Build the tab labels for a UI language."""
+    return {
+        "new": f"🆕 {t('rubric.tabs.new')}",
+        "history": f"📜 {t('rubric.tabs.history')}",
+        "help": f"❓ {t('rubric.tabs.help')}",
+    }
+
+
+# Minimum progress delta / seconds between iterative progress bar updates
+_PROGRESS_MIN_STEP = 0.01
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# Reuse results for identical generation configs within a session
+_GENERATION_CACHE_TTL = 3600.0
+_GENERATION_CACHE_MAX_ENTRIES = 64
+# Config fields left out of the cache key: retries, concurrency and rate limits
+# only change how the LLM calls are scheduled, not the prompts sent or the
+# rubrics returned, so a run with different settings may reuse the result
+_CACHE_NEUTRAL_FIELDS = frozenset({"max_retries", "max_concurrency", "requests_per_minute", "tokens_per_minute"})
+
+
+def _generation_cache_key(service_config: Any) -> str:
+    """Hash a generation config (including its type and dataset) into a cache key."""
+    payload = {"type": type(service_config).__name__, **dataclasses.asdict(service_config)}
+    for field in _CACHE_NEUTRAL_FIELDS:
+        payload.pop(field, None)
+    serialized = dump_json(payload, indent=False, sort_keys=True, default=str)
+    return hashlib.blake2b(serialized, digest_size=32).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _enum_maps() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Map sidebar option values to generator enums.
+
+    Returns:
+        Tuple of (grader mode map, language map)
+    """
+    from openjudge.graders.schema import GraderMode
+    from openjudge.models.schema.prompt_template import LanguageEnum
+
+    grader_modes = {"pointwise": GraderMode.POINTWISE, "listwise": GraderMode.LISTWISE}
+    languages = {"EN": LanguageEnum.EN, "ZH": LanguageEnum.ZH}
+    return grader_modes, languages
+
+
+# Static HTML templates; only the translated text is filled in per rerun
+_HEADER_TEMPLATE = """<div style="margin-bottom: 1rem;">
+                <h1 style="
+                    font-size: 2rem;
+                    font-weight: 700;
+                    color: #F1F5F9;
+                    margin: 0;
+                    display: flex;
+                    align-items: center;
+                    gap: 0.5rem;
+                ">
+                    <span>{icon}</span>
+                    <span>{name}</span>
+                </h1>
+                <p style="color: #94A3B8; margin: 0.25rem 0 0 0; font-size: 0.95rem;">
+                    {description}
+                </p>
+            </div>"""
+
+_HELP_INTRO_TEMPLATE = """
+            <div class="feature-card">
+                <div style="font-weight: 600; color: #F1F5F9; margin-bottom: 0.75rem;">
+                    {title}
+                </div>
+                <div style="color: #94A3B8; margin-bottom: 1rem;">
+                    {overview}
+                </div>
+            """
+
+_HELP_CARD_TEMPLATE_SIMPLE = """
+                <div style="color: #A5B4FC; font-weight: 500; margin-bottom: 0.5rem;">
+                    ⚡ {title}
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">1</div>
+                    <div class="guide-text">{step1}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">2</div>
+                    <div class="guide-text">{step2}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">3</div>
+                    <div class="guide-text">{step3}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">4</div>
+                    <div class="guide-text">{step4}</div>
+                </div>
+            </div>
+            """
+
+_HELP_CARD_TEMPLATE_ITERATIVE = """
+            <div class="feature-card" style="margin-top: 1rem;">
+                <div style="color: #34D399; font-weight: 500; margin-bottom: 0.5rem;">
+                    📊 {title}
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">1</div>
+                    <div class="guide-text">{step1}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">2</div>
+                    <div class="guide-text">{step2}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">3</div>
+                    <div class="guide-text">{step3}</div>
+                </div>
+                <div class="guide-step">
+                    <div class="guide-number">4</div>
+                    <div class="guide-text">{step4}</div>
+                </div>
+            </div>
+            """
+
+_TIPS_TEMPLATE = """
+            <div class="feature-card" style="margin-top: 1rem;">
+                <div style="font-weight: 600; color: #F1F5F9; margin-bottom: 0.75rem;">
+                    💡 {title}
+                </div>
+                <ul style="color: #94A3B8; margin: 0; padding-left: 1.25rem;">
+                    <li>{tip1}</li>
+                    <li>{tip2}</li>
+                    <li>{tip3}</li>
+                    <li>{tip4}</li>
+                </ul>
+            </div>
+            """
+
+_MODE_DESC_HTML = "<div style='font-size: 0.8rem; color: #94A3B8; text-align: center;'>{}</div>"
+
+
+@lru_cache(maxsize=8)
+def _mode_selector_text(lang: str) -> tuple[str, str, str, str, str]:
+    """Build the mode selector title, button labels and descriptions for a UI language.
+
+    Returns:
+        Tuple of (title_html, simple_label, simple_desc_html, iterative_label, iterative_desc_html)
+    """
+    title_html = f"""
+            <div style="
+                font-weight: 600;
+                color: #F1F5F9;
+                margin-bottom: 0.75rem;
+            ">{t('rubric.mode.title')}</div>
+            """
+    return (
+        title_html,
+        f"⚡ {t('rubric.mode.simple')}",
+        _MODE_DESC_HTML.format(t("rubric.mode.simple_desc")),
+        f"📊 {t('rubric.mode.iterative')}",
+        _MODE_DESC_HTML.format(t("rubric.mode.iterative_desc")),
+    )
 
 
 class AutoRubricFeature(BaseFeature):
@@ -60,6 +218,29 @@ class AutoRubricFeature(BaseFeature):
     STATE_GRADER = "rubric_grader"
     STATE_MODE = "rubric_generation_mode"
     STATE_VIEWING_TASK = "rubric_viewing_task"
+    STATE_ACTIVE_TAB = "rubric_active_tab"
+    STATE_INITIALIZED = "_rubric_initialized"
+    STATE_HISTORY_ERRORS = "_rubric_history_errors"
+    STATE_GENERATION_CACHE = "_rubric_generation_cache"
+
+    # Session state defaults as (key, value) pairs
+    _SESSION_DEFAULTS = (
+        (STATE_RESULT, None),
+        (STATE_CONFIG, None),
+        (STATE_GRADER, None),
+        (STATE_MODE, "simple"),
+        (STATE_VIEWING_TASK, None),
+        (STATE_ACTIVE_TAB, "new"),
+    )
+
+    # Test panel input keys cleared when a new grader is generated
+    _TEST_INPUT_KEYS = (
+        "rubric_test_response_count",
+        "rubric_test_query_compact",
+        "rubric_test_response_compact",
+        "rubric_test_response_compact_1",
+        "rubric_test_response_compact_2",
+    )
 
     @property
     def display_label(self) -> str:
@@ -69,54 +250,58 @@ class AutoRubricFeature(BaseFeature):
     def render_header(self) -> None:
         """Render the feature header with i18n support."""
         st.markdown(
-            f"""<div style="margin-bottom: 1rem;">
-                <h1 style="
-                    font-size: 2rem;
-                    font-weight: 700;
-                    color: #F1F5F9;
-                    margin: 0;
-                    display: flex;
-                    align-items: center;
-                    gap: 0.5rem;
-                ">
-                    <span>{self.feature_icon}</span>
-                    <span>{t('rubric.name')}</span>
-                </h1>
-                <p style="color: #94A3B8; margin: 0.25rem 0 0 0; font-size: 0.95rem;">
-                    {t('rubric.description')}
-                </p>
-            </div>""",
+            _HEADER_TEMPLATE.format(
+                icon=self.feature_icon,
+                name=t("rubric.name"),
+                description=t("rubric.description"),
+            ),
             unsafe_allow_html=True,
         )
 
     def render_sidebar(self) -> dict[str, Any]:
         """Render the Auto Rubric sidebar configuration."""
+        from features.auto_rubric.components.sidebar import render_rubric_sidebar
+
         return render_rubric_sidebar()
 
     def render_main_content(self, sidebar_config: dict[str, Any]) -> None:
         """Render the main content area for Auto Rubric."""
         self._init_session_state()
-
-        # Tab navigation
-        tab_new, tab_history, tab_help = st.tabs(
-            [
-                f"🆕 {t('rubric.tabs.new')}",
-                f"📜 {t('rubric.tabs.history')}",
-                f"❓ {t('rubric.tabs.help')}",
-            ]
+        self._render_history_errors()
+
+        # Tab navigation. st.tabs renders every tab body on each rerun, so a
+        # horizontal radio is used instead and only the active view is rendered.
+        active_tab = st.radio(
+            "tabs",
+            options=_TAB_VALUES,
+            format_func=_tab_labels(get_ui_language()).__getitem__,
+            horizontal=True,
+            label_visibility="collapsed",
+            key=self.STATE_ACTIVE_TAB,
         )
 
-        with tab_new:
-            self._render_new_rubric_view(sidebar_config)
-
-        with tab_history:
+        if active_tab == "history":
             self._render_history_view()
-
-        with tab_help:
+        elif active_tab == "help":
             self._render_help_view()
+        else:
+            self._render_new_rubric_view(sidebar_config)
 
     def _render_new_rubric_view(self, sidebar_config: dict[str, Any]) -> None:
         """Render the new rubric generation view."""
+        from features.auto_rubric.components.iterative_config_panel import (
+            render_iterative_config_panel,
+            validate_iterative_config,
+        )
+        from features.auto_rubric.components.result_panel import (
+            render_empty_result_panel,
+            render_result_panel,
+        )
+        from features.auto_rubric.components.simple_config_panel import (
+            render_simple_config_panel,
+            validate_simple_config,
+        )
+
         # Mode selection
         selected_mode = self._render_mode_selector()
 
@@ -138,8 +323,10 @@ class AutoRubricFeature(BaseFeature):
 
             st.markdown('<div style="margin: 1rem 0;"></div>', unsafe_allow_html=True)
 
+            # Fixed slot so the validation message is updated in place and cleared when valid
+            validation_slot = st.empty()
             if not is_valid:
-                st.warning(validation_msg)
+                validation_slot.warning(validation_msg)
 
             generate_clicked = st.button(
                 f"🚀 {t('rubric.config.generate')}",
@@ -151,16 +338,23 @@ class AutoRubricFeature(BaseFeature):
         with col_result:
             result_placeholder = st.empty()
 
-            result = st.session_state.get(self.STATE_RESULT)
-            stored_config = st.session_state.get(self.STATE_CONFIG)
-            stored_grader = st.session_state.get(self.STATE_GRADER)
-
-            with result_placeholder.container():
-                render_result_panel(
-                    result=result,
-                    config=stored_config,
-                    grader=stored_grader,
-                )
+            # The generation branch below takes over the placeholder, so skip
+            # rendering the previous (about to be cleared) result on that rerun
+            if not generate_clicked:
+                result = st.session_state.get(self.STATE_RESULT)
+                stored_config = st.session_state.get(self.STATE_CONFIG)
+                stored_grader = st.session_state.get(self.STATE_GRADER)
+
+                with result_placeholder.container():
+                    if result is None and stored_config is None:
+                        # Most common state before the first generation
+                        render_empty_result_panel()
+                    else:
+                        render_result_panel(
+                            result=result,
+                            config=stored_config,
+                            grader=stored_grader,
+                        )
 
         if generate_clicked:
             if selected_mode == "simple":
@@ -170,16 +364,10 @@ class AutoRubricFeature(BaseFeature):
 
     def _render_mode_selector(self) -> str:
         """Render the generation mode selector and return selected mode."""
-        st.markdown(
-            f"""
-            <div style="
-                font-weight: 600;
-                color: #F1F5F9;
-                margin-bottom: 0.75rem;
-            ">{t('rubric.mode.title')}</div>
-            """,
-            unsafe_allow_html=True,
+        title_html, simple_label, simple_desc_html, iterative_label, iterative_desc_html = _mode_selector_text(
+            get_ui_language()
         )
+        st.markdown(title_html, unsafe_allow_html=True)
 
         # Get current mode from session state
         current_mode = st.session_state.get(self.STATE_MODE, "simple")
@@ -189,7 +377,7 @@ class AutoRubricFeature(BaseFeature):
         with col1:
             simple_selected = current_mode == "simple"
             if st.button(
-                f"⚡ {t('rubric.mode.simple')}",
+                simple_label,
                 key="mode_simple",
                 use_container_width=True,
                 type="primary" if simple_selected else "secondary",
@@ -197,16 +385,12 @@ class AutoRubricFeature(BaseFeature):
                 st.session_state[self.STATE_MODE] = "simple"
                 st.rerun()
 
-            st.markdown(
-                f"<div style='font-size: 0.8rem; color: #94A3B8; text-align: center;'>"
-                f"{t('rubric.mode.simple_desc')}</div>",
-                unsafe_allow_html=True,
-            )
+            st.markdown(simple_desc_html, unsafe_allow_html=True)
 
         with col2:
             iterative_selected = current_mode == "iterative"
             if st.button(
-                f"📊 {t('rubric.mode.iterative')}",
+                iterative_label,
                 key="mode_iterative",
                 use_container_width=True,
                 type="primary" if iterative_selected else "secondary",
@@ -214,61 +398,99 @@ class AutoRubricFeature(BaseFeature):
                 st.session_state[self.STATE_MODE] = "iterative"
                 st.rerun()
 
-            st.markdown(
-                f"<div style='font-size: 0.8rem; color: #94A3B8; text-align: center;'>"
-                f"{t('rubric.mode.iterative_desc')}</div>",
-                unsafe_allow_html=True,
-            )
+            st.markdown(iterative_desc_html, unsafe_allow_html=True)
 
         return st.session_state.get(self.STATE_MODE, "simple")
 
-    def _clear_test_state(self) -> None:
-        """Clear all test-related session state.
+    def _reset_for_generation(self) -> None:
+        """Reset result and test-related session state before a new generation.
 
         This ensures a clean test panel when generating a new grader,
         preventing stale inputs/results from previous sessions.
         """
-        # Clear test results and running state
-        st.session_state["rubric_test_result"] = None
-        st.session_state["rubric_test_running"] = False
-
-        # Clear listwise test inputs
+        # Listwise test inputs, the response counter and compact (expander) test inputs
         response_count = st.session_state.get("rubric_test_response_count", 0)
-        for i in range(response_count):
-            key = f"rubric_test_response_{i}"
-            if key in st.session_state:
-                del st.session_state[key]
-        if "rubric_test_response_count" in st.session_state:
-            del st.session_state["rubric_test_response_count"]
-
-        # Clear compact test inputs (used in expander)
-        keys_to_clear = [
-            "rubric_test_query_compact",
-            "rubric_test_response_compact",
-            "rubric_test_response_compact_1",
-            "rubric_test_response_compact_2",
-        ]
-        for key in keys_to_clear:
-            if key in st.session_state:
-                del st.session_state[key]
+        stale_keys = [f"rubric_test_response_{i}" for i in range(response_count)]
+        stale_keys.extend(self._TEST_INPUT_KEYS)
+        for key in stale_keys:
+            st.session_state.pop(key, None)
+
+        st.session_state.update(
+            {
+                self.STATE_RESULT: None,
+                self.STATE_CONFIG: None,
+                self.STATE_GRADER: None,
+                "rubric_test_result": None,
+                "rubric_test_running": False,
+            }
+        )
+
+    @staticmethod
+    def _stage_log() -> Callable[[str], None]:
+        """Create a stage logger that renders all stage lines in one markdown element.
+
+        Returns:
+            Function appending a line and re-rendering the shared placeholder
+        """
+        slot = st.empty()
+        lines: list[str] = []
+
+        def log_stage(line: str) -> None:
+            lines.append(line)
+            slot.markdown("\n\n".join(lines))
+
+        return log_stage
+
+    def _get_cached_generation(self, cache_key: str) -> "GenerationResult | None":
+        """Return a cached successful generation for this config, if still fresh."""
+        entry = st.session_state.get(self.STATE_GENERATION_CACHE, {}).get(cache_key)
+        if entry is None or time.monotonic() - entry[0] > _GENERATION_CACHE_TTL:
+            return None
+        return entry[1]
+
+    def _store_cached_generation(self, cache_key: str, result: "GenerationResult") -> None:
+        """Cache a successful generation, evicting the oldest entries beyond the limit."""
+        if not result.success:
+            return
+        cache = st.session_state.setdefault(self.STATE_GENERATION_CACHE, {})
+        cache.pop(cache_key, None)
+        cache[cache_key] = (time.monotonic(), result)
+        while len(cache) > _GENERATION_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+
+    def _render_generated_result(self, result_placeholder: Any) -> None:
+        """Replace the generation status with the new result in place of a full rerun."""
+        from features.auto_rubric.components.result_panel import render_result_panel
+
+        result_placeholder.empty()
+        with result_placeholder.container():
+            render_result_panel(
+                result=st.session_state.get(self.STATE_RESULT),
+                config=st.session_state.get(self.STATE_CONFIG),
+                grader=st.session_state.get(self.STATE_GRADER),
+            )
 
     def _start_simple_generation(self, config: dict[str, Any], result_placeholder: Any) -> None:
         """Start Simple Rubric generation."""
-        st.session_state[self.STATE_RESULT] = None
-        st.session_state[self.STATE_CONFIG] = None
-        st.session_state[self.STATE_GRADER] = None
-        # Clear all test state to avoid showing stale data from previous grader
-        self._clear_test_state()
+        from features.auto_rubric.services.rubric_generator_service import (
+            SimpleRubricConfig,
+            get_rubric_generator_service,
+        )
+
+        # Clear previous result and all test state to avoid showing stale data
+        self._reset_for_generation()
 
         generation_success = False
 
         with result_placeholder.container():
             with st.status(f"🔄 {t('rubric.result.generating')}", expanded=True) as status:
                 try:
-                    st.write(f"**{t('rubric.result.init_model')}**")
+                    log_stage = self._stage_log()
+                    log_stage(f"**{t('rubric.result.init_model')}**")
 
-                    grader_mode = GraderMode.POINTWISE if config["grader_mode"] == "pointwise" else GraderMode.LISTWISE
-                    language = LanguageEnum.ZH if config["language"] == "ZH" else LanguageEnum.EN
+                    grader_modes, languages = _enum_maps()
+                    grader_mode = grader_modes[config["grader_mode"]]
+                    language = languages[config["language"]]
 
                     service_config = SimpleRubricConfig(
                         grader_name=config["grader_name"],
@@ -280,17 +502,24 @@ class AutoRubricFeature(BaseFeature):
                         min_score=config.get("min_score", 0),
                         max_score=config.get("max_score", 5),
                         max_retries=config.get("max_retries", 3),
+                        requests_per_minute=config.get("requests_per_minute"),
+                        tokens_per_minute=config.get("tokens_per_minute"),
                         api_endpoint=config["api_endpoint"],
                         api_key=config["api_key"],
                         model_name=config["model_name"],
                     )
 
-                    st.write(f"**{t('rubric.result.calling_api')}**")
+                    log_stage(f"**{t('rubric.result.calling_api')}**")
 
-                    service = RubricGeneratorService()
-                    result = run_async(service.generate_simple(service_config))
+                    cache_key = _generation_cache_key(service_config)
+                    result = self._get_cached_generation(cache_key)
+                    cache_hit = result is not None
+                    if not cache_hit:
+                        service = get_rubric_generator_service()
+                        result = wait_async(service.generate_simple(service_config))
+                        self._store_cached_generation(cache_key, result)
 
-                    st.write(f"**{t('rubric.result.processing')}**")
+                    log_stage(f"**{t('rubric.result.processing')}**")
 
                     if result.success:
                         st.session_state[self.STATE_RESULT] = {
@@ -301,8 +530,9 @@ class AutoRubricFeature(BaseFeature):
                         st.session_state[self.STATE_CONFIG] = result.grader_config
                         st.session_state[self.STATE_GRADER] = result.grader
 
-                        # Save to history
-                        self._save_to_history(config, result.rubrics, result.grader_config, "simple")
+                        # A cached result was already saved when it was generated
+                        if not cache_hit:
+                            self._save_to_history(config, result.rubrics, result.grader_config, "simple")
 
                         status.update(label=f"✅ {t('rubric.result.success')}", state="complete")
                         generation_success = True
@@ -323,25 +553,29 @@ class AutoRubricFeature(BaseFeature):
                     st.error(t("rubric.result.error", error=str(e)))
 
         if generation_success:
-            st.rerun()
+            self._render_generated_result(result_placeholder)
 
     def _start_iterative_generation(self, config: dict[str, Any], result_placeholder: Any) -> None:
         """Start Iterative Rubric generation."""
-        st.session_state[self.STATE_RESULT] = None
-        st.session_state[self.STATE_CONFIG] = None
-        st.session_state[self.STATE_GRADER] = None
-        # Clear all test state to avoid showing stale data from previous grader
-        self._clear_test_state()
+        from features.auto_rubric.services.rubric_generator_service import (
+            IterativeRubricConfig,
+            get_rubric_generator_service,
+        )
+
+        # Clear previous result and all test state to avoid showing stale data
+        self._reset_for_generation()
 
         generation_success = False
 
         with result_placeholder.container():
             with st.status(f"🔄 {t('rubric.result.generating')}", expanded=True) as status:
                 try:
-                    st.write(f"**{t('rubric.result.init_model')}**")
+                    log_stage = self._stage_log()
+                    log_stage(f"**{t('rubric.result.init_model')}**")
 
-                    grader_mode = GraderMode.POINTWISE if config["grader_mode"] == "pointwise" else GraderMode.LISTWISE
-                    language = LanguageEnum.ZH if config["language"] == "ZH" else LanguageEnum.EN
+                    grader_modes, languages = _enum_maps()
+                    grader_mode = grader_modes[config["grader_mode"]]
+                    language = languages[config["language"]]
 
                     service_config = IterativeRubricConfig(
                         grader_name=config["grader_name"],
@@ -355,33 +589,76 @@ class AutoRubricFeature(BaseFeature):
                         categories_number=config.get("categories_number", 5),
                         query_specific_generate_number=config.get("query_specific_generate_number", 2),
                         max_retries=config.get("max_retries", 3),
+                        requests_per_minute=config.get("requests_per_minute"),
+                        tokens_per_minute=config.get("tokens_per_minute"),
                         api_endpoint=config["api_endpoint"],
                         api_key=config["api_key"],
                         model_name=config["model_name"],
                     )
 
-                    st.write(f"**{t('rubric.iterative.generating_rubrics')}**")
-                    st.write(f"{t('rubric.iterative.data_count')}: {config.get('data_count', 0)}")
+                    log_stage(
+                        f"**{t('rubric.iterative.generating_rubrics')}**\n\n"
+                        f"{t('rubric.iterative.data_count')}: {config.get('data_count', 0)}"
+                    )
 
-                    service = RubricGeneratorService()
+                    cache_key = _generation_cache_key(service_config)
+                    result = self._get_cached_generation(cache_key)
+                    cache_hit = result is not None
+                    if not cache_hit:
+                        service = get_rubric_generator_service()
 
-                    # Progress callback
-                    progress_placeholder = st.empty()
+                        # Progress callback
+                        progress_placeholder = st.empty()
 
-                    def on_progress(stage: str, pct: float) -> None:
                         stage_names = {
                             "init": t("rubric.result.init_model"),
                             "generating": t("rubric.iterative.generating_rubrics"),
                             "processing": t("rubric.result.processing"),
                             "complete": t("rubric.result.success"),
                         }
-                        stage_name = stage_names.get(stage, stage)
-                        progress_placeholder.progress(pct, text=f"{stage_name} ({int(pct * 100)}%)")
-
-                    result = run_async(service.generate_iterative(service_config, on_progress))
-
-                    progress_placeholder.empty()
-                    st.write(f"**{t('rubric.result.processing')}**")
+                        last_emit_pct = -1.0
+                        last_emit_ts = 0.0
+
+                        def show_progress(stage: str, pct: float) -> None:
+                            nonlocal last_emit_pct, last_emit_ts
+                            # Throttle UI updates to ~1% steps / 10 Hz; always show completion
+                            now = time.monotonic()
+                            if (
+                                stage != "complete"
+                                and pct - last_emit_pct < _PROGRESS_MIN_STEP
+                                and now - last_emit_ts < _PROGRESS_MIN_INTERVAL
+                            ):
+                                return
+                            last_emit_pct, last_emit_ts = pct, now
+                            stage_name = stage_names.get(stage, stage)
+                            progress_placeholder.progress(pct, text=f"{stage_name} ({int(pct * 100)}%)")
+
+                        # Generation runs on the shared background loop; its progress callback
+                        # only enqueues events, which are rendered here on the script thread
+                        progress_events: queue.SimpleQueue[tuple[str, float]] = queue.SimpleQueue()
+                        future = submit_async(
+                            service.generate_iterative(
+                                service_config,
+                                lambda stage, pct: progress_events.put((stage, pct)),
+                            )
+                        )
+                        try:
+                            while True:
+                                done = future.done()
+                                while not progress_events.empty():
+                                    show_progress(*progress_events.get_nowait())
+                                if done:
+                                    break
+                                concurrent.futures.wait([future], timeout=_PROGRESS_MIN_INTERVAL)
+                            result = future.result()
+                        except BaseException:
+                            # A rerun or stop interrupted the script; don't keep spending API calls
+                            future.cancel()
+                            raise
+                        self._store_cached_generation(cache_key, result)
+                        progress_placeholder.empty()
+
+                    log_stage(f"**{t('rubric.result.processing')}**")
 
                     if result.success:
                         st.session_state[self.STATE_RESULT] = {
@@ -392,14 +669,15 @@ class AutoRubricFeature(BaseFeature):
                         st.session_state[self.STATE_CONFIG] = result.grader_config
                         st.session_state[self.STATE_GRADER] = result.grader
 
-                        # Save to history
-                        self._save_to_history(
-                            config,
-                            result.rubrics,
-                            result.grader_config,
-                            "iterative",
-                            data_count=config.get("data_count"),
-                        )
+                        # A cached result was already saved when it was generated
+                        if not cache_hit:
+                            self._save_to_history(
+                                config,
+                                result.rubrics,
+                                result.grader_config,
+                                "iterative",
+                                data_count=config.get("data_count"),
+                            )
 
                         status.update(label=f"✅ {t('rubric.result.success')}", state="complete")
                         generation_success = True
@@ -420,7 +698,7 @@ class AutoRubricFeature(BaseFeature):
                     st.error(t("rubric.result.error", error=str(e)))
 
         if generation_success:
-            st.rerun()
+            self._render_generated_result(result_placeholder)
 
     def _save_to_history(
         self,
@@ -430,32 +708,78 @@ class AutoRubricFeature(BaseFeature):
         mode: str,
         data_count: int | None = None,
     ) -> None:
-        """Save generated grader to history."""
+        """Save generated grader to history without blocking the UI.
+
+        The task ID is assigned synchronously; the files are written by a
+        background thread. Failures are queued and reported on the next rerun.
+        """
+        from features.auto_rubric.services.history_manager import get_history_manager
+
+        history_manager = get_history_manager()
+        created_at = datetime.now()
+        task_id = history_manager.generate_task_id(created_at)
+        errors = st.session_state.setdefault(self.STATE_HISTORY_ERRORS, [])
+        threading.Thread(
+            target=self._persist_history,
+            args=(history_manager, errors, task_id, created_at, dict(config), rubrics, grader_config, mode, data_count),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _persist_history(
+        history_manager: "HistoryManager",
+        errors: list[tuple[str, str | None]],
+        task_id: str,
+        created_at: datetime,
+        config: dict[str, Any],
+        rubrics: str,
+        grader_config: dict[str, Any],
+        mode: str,
+        data_count: int | None,
+    ) -> None:
+        """Write a generated grader to history (runs in a background thread)."""
         try:
-            history_manager = HistoryManager()
-            task_id = history_manager.generate_task_id()
-            history_manager.save_grader(
+            saved = history_manager.save_grader(
                 task_id=task_id,
                 config=config,
                 rubrics=rubrics,
                 grader_config=grader_config,
                 mode=mode,
                 data_count=data_count,
+                created_at=created_at,
             )
+            if not saved:
+                # save_grader logs the cause; the warning names the task instead
+                errors.append((task_id, None))
         except Exception as e:
             # Don't fail the generation if history save fails
-            st.warning(f"Failed to save to history: {e}")
+            errors.append((task_id, str(e)))
+
+    def _render_history_errors(self) -> None:
+        """Report history saves that failed in the background since the last rerun."""
+        errors = st.session_state.get(self.STATE_HISTORY_ERRORS)
+        while errors:
+            task_id, error = errors.pop(0)
+            if error is None:
+                error = t("rubric.history.write_failed", task_id=task_id)
+            st.warning(t("rubric.history.save_failed", error=error))
 
     def _render_history_view(self) -> None:
         """Render the history view."""
         viewing_task = st.session_state.get(self.STATE_VIEWING_TASK)
 
         if viewing_task:
+            from features.auto_rubric.components.history_panel import render_task_detail
+
             render_task_detail(
                 task_id=viewing_task,
                 on_back=self._on_back_from_detail,
             )
         else:
+            from features.auto_rubric.components.history_panel import (
+                render_history_panel,
+            )
+
             render_history_panel(
                 on_view=self._on_view_task,
                 on_delete=self._on_delete_task,
@@ -469,7 +793,9 @@ class AutoRubricFeature(BaseFeature):
 
     def _on_delete_task(self, task_id: str) -> None:
         """Handle delete task button click."""
-        history_manager = HistoryManager()
+        from features.auto_rubric.services.history_manager import get_history_manager
+
+        history_manager = get_history_manager()
         if history_manager.delete_task(task_id):
             st.success(t("rubric.history.deleted", task_id=task_id))
             st.rerun()
@@ -484,103 +810,56 @@ class AutoRubricFeature(BaseFeature):
     def _render_help_view(self) -> None:
         """Render the help view with quick start guide."""
         st.markdown(
-            f"""
-            <div class="feature-card">
-                <div style="font-weight: 600; color: #F1F5F9; margin-bottom: 0.75rem;">
-                    {t("rubric.help.title")}
-                </div>
-                <div style="color: #94A3B8; margin-bottom: 1rem;">
-                    {t("rubric.help.overview")}
-                </div>
-            """,
+            _HELP_INTRO_TEMPLATE.format(
+                title=t("rubric.help.title"),
+                overview=t("rubric.help.overview"),
+            ),
             unsafe_allow_html=True,
         )
 
         # Simple Rubric steps
         st.markdown(
-            f"""
-                <div style="color: #A5B4FC; font-weight: 500; margin-bottom: 0.5rem;">
-                    ⚡ {t("rubric.help.simple_title")}
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">1</div>
-                    <div class="guide-text">{t("rubric.help.simple_step1")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">2</div>
-                    <div class="guide-text">{t("rubric.help.simple_step2")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">3</div>
-                    <div class="guide-text">{t("rubric.help.simple_step3")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">4</div>
-                    <div class="guide-text">{t("rubric.help.simple_step4")}</div>
-                </div>
-            </div>
-            """,
+            _HELP_CARD_TEMPLATE_SIMPLE.format(
+                title=t("rubric.help.simple_title"),
+                step1=t("rubric.help.simple_step1"),
+                step2=t("rubric.help.simple_step2"),
+                step3=t("rubric.help.simple_step3"),
+                step4=t("rubric.help.simple_step4"),
+            ),
             unsafe_allow_html=True,
         )
 
         # Iterative Rubric steps
         st.markdown(
-            f"""
-            <div class="feature-card" style="margin-top: 1rem;">
-                <div style="color: #34D399; font-weight: 500; margin-bottom: 0.5rem;">
-                    📊 {t("rubric.help.iterative_title")}
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">1</div>
-                    <div class="guide-text">{t("rubric.help.iterative_step1")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">2</div>
-                    <div class="guide-text">{t("rubric.help.iterative_step2")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">3</div>
-                    <div class="guide-text">{t("rubric.help.iterative_step3")}</div>
-                </div>
-                <div class="guide-step">
-                    <div class="guide-number">4</div>
-                    <div class="guide-text">{t("rubric.help.iterative_step4")}</div>
-                </div>
-            </div>
-            """,
+            _HELP_CARD_TEMPLATE_ITERATIVE.format(
+                title=t("rubric.help.iterative_title"),
+                step1=t("rubric.help.iterative_step1"),
+                step2=t("rubric.help.iterative_step2"),
+                step3=t("rubric.help.iterative_step3"),
+                step4=t("rubric.help.iterative_step4"),
+            ),
             unsafe_allow_html=True,
         )
 
         # Tips
         st.markdown(
-            f"""
-            <div class="feature-card" style="margin-top: 1rem;">
-                <div style="font-weight: 600; color: #F1F5F9; margin-bottom: 0.75rem;">
-                    💡 {t("rubric.help.tips_title")}
-                </div>
-                <ul style="color: #94A3B8; margin: 0; padding-left: 1.25rem;">
-                    <li>{t("rubric.help.tip1")}</li>
-                    <li>{t("rubric.help.tip2")}</li>
-                    <li>{t("rubric.help.tip3")}</li>
-                    <li>{t("rubric.help.tip4")}</li>
-                </ul>
-            </div>
-            """,
+            _TIPS_TEMPLATE.format(
+                title=t("rubric.help.tips_title"),
+                tip1=t("rubric.help.tip1"),
+                tip2=t("rubric.help.tip2"),
+                tip3=t("rubric.help.tip3"),
+                tip4=t("rubric.help.tip4"),
+            ),
             unsafe_allow_html=True,
         )
 
     def _init_session_state(self) -> None:
         """Initialize session state variables."""
-        defaults = {
-            self.STATE_RESULT: None,
-            self.STATE_CONFIG: None,
-            self.STATE_GRADER: None,
-            self.STATE_MODE: "simple",
-            self.STATE_VIEWING_TASK: None,
-        }
-        for key, default in defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = default
+        if st.session_state.get(self.STATE_INITIALIZED):
+            return
+        for key, default in self._SESSION_DEFAULTS:
+            st.session_state.setdefault(key, default)
+        st.session_state[self.STATE_INITIALIZED] = True
 
     def on_mount(self) -> None:
         """Initialize Auto Rubric feature state when mounted."""
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """Services for Auto Rubric feature."""
 
-from features.auto_rubric.services.data_parser import DataParser, ParseResult
+from features.auto_rubric.services.data_parser import (
+    DataParser,
+    ParseResult,
+    get_data_parser,
+)
 from features.auto_rubric.services.export_service import ExportService
-from features.auto_rubric.services.history_manager import HistoryManager
+from features.auto_rubric.services.history_manager import (
+    HistoryManager,
+    get_history_manager,
+)
 from features.auto_rubric.services.rubric_generator_service import (
     GenerationResult,
     IterativeRubricConfig,
     RubricGeneratorService,
     SimpleRubricConfig,
+    get_rubric_generator_service,
 )
 
 __all__ = [
@@ -16,8 +24,11 @@ __all__ = [
     "ExportService",
     "DataParser",
     "ParseResult",
+    "get_data_parser",
     "HistoryManager",
+    "get_history_manager",
     "SimpleRubricConfig",
     "IterativeRubricConfig",
     "GenerationResult",
+    "get_rubric_generator_service",
 ]
@@ -5,13 +5,43 @@ Parses and validates uploaded data files for Iterative Rubric generation.
 Supports JSON, JSONL, and CSV formats.
 """
 
-import csv
+import importlib.util
 import io
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 from loguru import logger
+from shared.utils.json_io import HAS_ORJSON
+from shared.utils.json_io import loads as _json_loads
+
+# Without orjson, bind a decoder once so the per-cell CSV decode skips
+# json.loads' argument dispatch
+_json_decode = _json_loads if HAS_ORJSON else json.JSONDecoder().decode
+
+try:
+    import ijson
+except ImportError:  # large JSON uploads are parsed in one go instead
+    ijson = None
+
+# pyarrow ships with streamlit, but it is slow to import, so it is only
+# loaded on the first CSV upload; the csv module is the fallback
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# JSON uploads above this size are streamed with ijson when it is installed
+_STREAM_JSON_BYTES = 1 << 20
+
+
+def _truncate_str(value: str) -> str:
+    return value[:100] + "..." if len(value) > 100 else value
+
+
+def _truncate_list(value: list) -> list:
+    return value[:3] + ["..."] if len(value) > 3 else value
+
+
+# Preview truncation by exact value type; other types are shown as-is
+_PREVIEW_TRUNCATORS = {str: _truncate_str, list: _truncate_list}
 
 
 @dataclass
@@ -55,9 +85,12 @@ class DataParser:
     # Maximum records allowed
     MAX_RECORDS = 500
 
+    # Maximum upload size, checked before any parsing
+    MAX_BYTES = 50 * 1024 * 1024
+
     # Required fields for different modes
-    POINTWISE_REQUIRED = {"query", "response", "label_score"}
-    LISTWISE_REQUIRED = {"query", "responses", "label_rank"}
+    POINTWISE_REQUIRED = frozenset({"query", "response", "label_score"})
+    LISTWISE_REQUIRED = frozenset({"query", "responses", "label_rank"})
 
     def parse_file(
         self,
@@ -75,6 +108,13 @@ class DataParser:
         Returns:
             ParseResult with parsed data or error information.
         """
+        if len(file_content) > self.MAX_BYTES:
+            return ParseResult(
+                success=False,
+                error=f"File too large: {len(file_content) / 1024 / 1024:.1f} MB. "
+                f"Maximum allowed: {self.MAX_BYTES // 1024 // 1024} MB",
+            )
+
         try:
             # Determine file format
             ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
@@ -100,9 +140,11 @@ class DataParser:
 
     def _parse_json(self, content: bytes, mode: str) -> ParseResult:
         """Parse JSON file content."""
+        if ijson is not None and len(content) > _STREAM_JSON_BYTES:
+            return self._stream_json(content, mode)
+
         try:
-            text = content.decode("utf-8")
-            data = json.loads(text)
+            data = _json_loads(content)
 
             # Handle {"data": [...]} format
             if isinstance(data, dict) and "data" in data:
@@ -122,19 +164,61 @@ class DataParser:
                 error=f"Invalid JSON format: {str(e)}",
             )
 
+    def _stream_json(self, content: bytes, mode: str) -> ParseResult:
+        """Stream records out of a large JSON file, stopping past MAX_RECORDS."""
+        head = content[:1024].lstrip(b" \t\r\n")
+        if head[:1] == b"{":
+            prefix = "data.item"
+        elif head[:1] == b"[":
+            prefix = "item"
+        else:
+            return ParseResult(
+                success=False,
+                error='JSON must be an array or {"data": [...]} format',
+            )
+
+        try:
+            data = []
+            for item in ijson.items(io.BytesIO(content), prefix, use_float=True):
+                data.append(item)
+                if len(data) > self.MAX_RECORDS:
+                    return ParseResult(
+                        success=False,
+                        error=f"Too many records. Maximum allowed: {self.MAX_RECORDS}",
+                    )
+
+            return self._validate_and_return(data, mode)
+
+        except ijson.JSONError as e:
+            return ParseResult(
+                success=False,
+                error=f"Invalid JSON format: {str(e)}",
+            )
+
     def _parse_jsonl(self, content: bytes, mode: str) -> ParseResult:
         """Parse JSONL file content (one JSON object per line)."""
         try:
-            text = content.decode("utf-8")
-            lines = text.strip().split("\n")
+            # Files that fit within the record limit are parsed as one synthetic
+            # array; anything else goes line by line for early abort and errors
+            if content.count(b"\n") < self.MAX_RECORDS:
+                lines = [line for line in content.split(b"\n") if line.strip()]
+                try:
+                    data = _json_loads(b"[" + b",".join(lines) + b"]")
+                except json.JSONDecodeError:
+                    data = None
+                # A line holding several comma-separated values is not valid JSONL
+                if data is not None and len(data) == len(lines):
+                    return self._validate_and_return(data, mode)
+
             data = []
 
-            for i, line in enumerate(lines, 1):
+            # Iterate the buffer so no list of lines is built up front
+            for i, line in enumerate(io.BytesIO(content), 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    item = json.loads(line)
+                    item = _json_loads(line)
                     data.append(item)
                 except json.JSONDecodeError as e:
                     return ParseResult(
@@ -142,6 +226,13 @@ class DataParser:
                         error=f"Invalid JSON at line {i}: {str(e)}",
                     )
 
+                # Stop reading as soon as the record limit is exceeded
+                if len(data) > self.MAX_RECORDS:
+                    return ParseResult(
+                        success=False,
+                        error=f"Too many records. Maximum allowed: {self.MAX_RECORDS}",
+                    )
+
             return self._validate_and_return(data, mode)
 
         except Exception as e:
@@ -153,36 +244,19 @@ class DataParser:
     def _parse_csv(self, content: bytes, mode: str) -> ParseResult:
         """Parse CSV file content."""
         try:
-            text = content.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text))
-            data = []
-
-            for row in reader:
-                # Convert empty strings to None
-                item = {k: (v if v else None) for k, v in row.items()}
-
-                # Try to parse label_score as number
-                if "label_score" in item and item["label_score"]:
-                    try:
-                        item["label_score"] = float(item["label_score"])
-                    except ValueError:
-                        pass
-
-                # Try to parse label_rank as list
-                if "label_rank" in item and item["label_rank"]:
-                    try:
-                        item["label_rank"] = json.loads(item["label_rank"])
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-
-                # Try to parse responses as list (for listwise mode)
-                if "responses" in item and item["responses"]:
-                    try:
-                        item["responses"] = json.loads(item["responses"])
-                    except (json.JSONDecodeError, ValueError):
-                        pass
+            if _HAS_PYARROW:
+                data = self._read_csv_arrow(content)
+            else:
+                data = self._read_csv(content)
 
-                data.append(item)
+            for item in data:
+                # Try to parse label_rank and responses (listwise mode) as lists
+                for field in ("label_rank", "responses"):
+                    if item.get(field):
+                        try:
+                            item[field] = _json_decode(item[field])
+                        except (json.JSONDecodeError, ValueError):
+                            pass
 
             return self._validate_and_return(data, mode)
 
@@ -192,6 +266,92 @@ class DataParser:
                 error=f"Failed to parse CSV: {str(e)}",
             )
 
+    @staticmethod
+    def _read_csv(content: bytes) -> list[dict[str, Any]]:
+        """Read CSV rows with the stdlib reader."""
+        import csv
+
+        reader = csv.reader(io.StringIO(content.decode("utf-8-sig")))
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        width = len(header)
+        score_index = header.index("label_score") if "label_score" in header else -1
+        data = []
+
+        for row in reader:
+            if not row:
+                continue
+
+            # Convert empty strings to None; short rows are padded like DictReader
+            values = [v or None for v in row]
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+
+            # Try to parse label_score as number
+            if score_index >= 0 and values[score_index]:
+                try:
+                    values[score_index] = float(values[score_index])
+                except ValueError:
+                    pass
+
+            data.append(dict(zip(header, values)))
+
+        return data
+
+    @staticmethod
+    def _read_csv_arrow(content: bytes) -> list[dict[str, Any]]:
+        """Read CSV rows with pyarrow's multi-threaded reader.
+
+        The options mirror the stdlib reader: every column is read as a string,
+        only empty cells become None, and quoted cells may span lines. Files
+        arrow rejects, such as ragged rows, are re-read with ``_read_csv``.
+        """
+        import csv
+
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        if not content.strip():
+            return []
+
+        header_line = content.split(b"\n", 1)[0].decode("utf-8-sig")
+        header = next(csv.reader([header_line]), [])
+        try:
+            table = pa_csv.read_csv(
+                io.BytesIO(content),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    null_values=[""],
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            logger.debug(f"pyarrow could not read CSV, using csv module: {e}")
+            return DataParser._read_csv(content)
+
+        score_cast = True
+        if "label_score" in table.column_names:
+            index = table.column_names.index("label_score")
+            try:
+                table = table.set_column(index, "label_score", table.column(index).cast(pa.float64()))
+            except pa.ArrowInvalid:
+                score_cast = False
+
+        data = table.to_pylist()
+
+        if not score_cast:
+            # Mixed column: convert cell by cell and keep non-numeric values as-is
+            for item in data:
+                try:
+                    item["label_score"] = float(item["label_score"])
+                except (TypeError, ValueError):
+                    pass
+
+        return data
+
     def _validate_and_return(
         self,
         data: list[dict[str, Any]],
@@ -217,24 +377,23 @@ class DataParser:
         warnings = []
         valid_data = []
 
-        for i, item in enumerate(data, 1):
-            item_keys = set(item.keys())
-            missing = required - item_keys
-
-            if missing:
-                warnings.append(f"Record {i}: missing fields {missing}")
-                continue
+        warn = warnings.append
+        keep = valid_data.append
 
-            # Check for None/empty required values
-            has_empty = False
+        for i, item in enumerate(data, 1):
+            # A single lookup per field covers both the missing and empty cases;
+            # the rarer failure path works out which one it was.
             for field in required:
-                if item.get(field) is None or item.get(field) == "":
-                    has_empty = True
-                    warnings.append(f"Record {i}: empty value for '{field}'")
+                value = item.get(field)
+                if value is None or value == "":
+                    missing = {f for f in required if f not in item}
+                    if missing:
+                        warn(f"Record {i}: missing fields {missing}")
+                    else:
+                        warn(f"Record {i}: empty value for '{field}'")
                     break
-
-            if not has_empty:
-                valid_data.append(item)
+            else:
+                keep(item)
 
         if not valid_data:
             return ParseResult(
@@ -268,11 +427,23 @@ class DataParser:
         for item in data[:max_items]:
             preview_item = {}
             for k, v in item.items():
-                if isinstance(v, str) and len(v) > 100:
-                    preview_item[k] = v[:100] + "..."
-                elif isinstance(v, list) and len(v) > 3:
-                    preview_item[k] = v[:3] + ["..."]
-                else:
-                    preview_item[k] = v
+                truncate = _PREVIEW_TRUNCATORS.get(type(v))
+                preview_item[k] = truncate(v) if truncate else v
             preview.append(preview_item)
         return preview
+
+
+# Global data parser instance
+_data_parser: Optional[DataParser] = None
+
+
+def get_data_parser() -> DataParser:
+    """Get the global data parser instance.
+
+    Returns:
+        DataParser instance shared across uploads
+    """
+    global _data_parser
+    if _data_parser is None:
+        _data_parser = DataParser()
+    return _data_parser
@@ -7,10 +7,10 @@ This service handles exporting generated graders to various formats:
 - JSON configuration (.json)
 """
 
-import json
 from typing import Any
 
 import yaml
+from shared.utils.json_io import dump_json
 
 
 class ExportService:
@@ -183,7 +183,7 @@ if __name__ == "__main__":
         if config.get("scenario"):
             json_config["scenario"] = config.get("scenario")
 
-        return json.dumps(json_config, indent=2, ensure_ascii=False)
+        return dump_json(json_config).decode("utf-8")
 
     def get_filename(self, grader_name: str, format_type: str) -> str:
         """Get the filename for export.
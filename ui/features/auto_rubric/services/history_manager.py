@@ -4,13 +4,29 @@
 Manages the storage and retrieval of generated graders and their configurations.
 """
 
-import json
+import os
+import re
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from loguru import logger
+from shared.utils.json_io import dump_json, load_json
+
+# Task IDs look like rubric_YYYYMMDD_HHMMSS, optionally followed by _N
+_TASK_ID_PREFIX = "rubric_"
+_TASK_ID_BASE_LEN = len("rubric_YYYYMMDD_HHMMSS")
+
+# Numbered items ("1.", "2.") or "Rubric 1:" headers at line start
+_RUBRIC_ITEM_RE = re.compile(r"(?:^\d+\.|^Rubric \d+:)", re.MULTILINE)
+
+
+def _task_id_order(task_id: str) -> tuple[str, int]:
+    """Sort key ordering task IDs by creation time, then same-second sequence."""
+    seq = task_id[_TASK_ID_BASE_LEN + 1 :]
+    return task_id[:_TASK_ID_BASE_LEN], int(seq) if seq.isdigit() else 0
 
 
 class HistoryManager:
@@ -44,14 +60,35 @@ class HistoryManager:
         # Ensure directory exists
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-    def generate_task_id(self) -> str:
+        # In-memory sequence for IDs issued within the same second
+        self._id_lock = threading.Lock()
+        self._last_id_base = ""
+        self._id_seq = 0
+
+        # Parsed config.json per task, keyed by path and validated by mtime
+        self._config_cache: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+    def generate_task_id(self, now: datetime | None = None) -> str:
         """Generate a unique task ID.
 
+        IDs are derived from the current time without scanning the history
+        directory; a counter suffix disambiguates IDs issued in the same second.
+
+        Args:
+            now: Creation time to derive the ID from. Defaults to the current time;
+                 pass the same value to save_grader as created_at to keep both in step.
+
         Returns:
-            Task ID in format: rubric_YYYYMMDD_HHMMSS
+            Task ID in format: rubric_YYYYMMDD_HHMMSS (or rubric_YYYYMMDD_HHMMSS_N)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"rubric_{timestamp}"
+        base = f"rubric_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}"
+        with self._id_lock:
+            if base == self._last_id_base:
+                self._id_seq += 1
+                return f"{base}_{self._id_seq}"
+            self._last_id_base = base
+            self._id_seq = 0
+            return base
 
     def save_grader(
         self,
@@ -61,6 +98,7 @@ class HistoryManager:
         grader_config: dict[str, Any],
         mode: str = "simple",
         data_count: int | None = None,
+        created_at: datetime | None = None,
     ) -> bool:
         """Save a generated grader to history.
 
@@ -71,13 +109,18 @@ class HistoryManager:
             grader_config: Grader configuration for export.
             mode: Generation mode ("simple" or "iterative").
             data_count: Number of training data records (for iterative mode).
+            created_at: Creation time recorded in config.json. Defaults to now.
 
         Returns:
             True if save was successful.
         """
+        task_dir = self.base_dir / task_id
+        # Files are staged in a hidden sibling and renamed into place, so
+        # list_tasks/get_task_details never see a partially written task
+        staging_dir = self.base_dir / f".{task_id}.tmp"
+
         try:
-            task_dir = self.base_dir / task_id
-            task_dir.mkdir(parents=True, exist_ok=True)
+            staging_dir.mkdir(parents=True, exist_ok=True)
 
             # Save configuration
             config_data = {
@@ -90,26 +133,28 @@ class HistoryManager:
                 "min_score": config.get("min_score", 0),
                 "max_score": config.get("max_score", 5),
                 "data_count": data_count,
-                "created_at": datetime.now().isoformat(),
+                "created_at": (created_at or datetime.now()).isoformat(),
                 "model_name": config.get("model_name", ""),
             }
 
-            with open(task_dir / "config.json", "w", encoding="utf-8") as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            (staging_dir / "config.json").write_bytes(dump_json(config_data))
 
             # Save rubrics text
-            with open(task_dir / "rubrics.txt", "w", encoding="utf-8") as f:
-                f.write(rubrics)
+            (staging_dir / "rubrics.txt").write_text(rubrics, encoding="utf-8")
 
             # Save grader configuration
-            with open(task_dir / "grader.json", "w", encoding="utf-8") as f:
-                json.dump(grader_config, f, ensure_ascii=False, indent=2)
+            (staging_dir / "grader.json").write_bytes(dump_json(grader_config))
+
+            if task_dir.exists():
+                shutil.rmtree(task_dir)
+            os.replace(staging_dir, task_dir)
 
             logger.info(f"Saved grader to history: {task_id}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to save grader: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
             return False
 
     def list_tasks(self, limit: int = 20) -> list[dict[str, Any]]:
@@ -124,17 +169,30 @@ class HistoryManager:
         tasks = []
 
         try:
-            for task_dir in self.base_dir.iterdir():
-                if not task_dir.is_dir():
-                    continue
+            # DirEntry.is_dir() reuses the type from readdir instead of a stat call
+            with os.scandir(self.base_dir) as entries:
+                task_ids = [e.name for e in entries if e.name.startswith(_TASK_ID_PREFIX) and e.is_dir()]
+
+            # Task IDs encode the creation time, so configs are only read for
+            # the newest entries until `limit` tasks have been collected
+            for task_id in sorted(task_ids, key=_task_id_order, reverse=True):
+                if len(tasks) >= limit:
+                    break
 
+                task_dir = self.base_dir / task_id
                 config_file = task_dir / "config.json"
-                if not config_file.exists():
+                try:
+                    mtime = config_file.stat().st_mtime_ns
+                except FileNotFoundError:
                     continue
 
                 try:
-                    with open(config_file, "r", encoding="utf-8") as f:
-                        config = json.load(f)
+                    cached = self._config_cache.get(config_file)
+                    if cached is not None and cached[0] == mtime:
+                        config = cached[1]
+                    else:
+                        config = load_json(config_file)
+                        self._config_cache[config_file] = (mtime, config)
 
                     tasks.append(
                         {
@@ -151,10 +209,7 @@ class HistoryManager:
                     logger.warning(f"Failed to read config for {task_dir.name}: {e}")
                     continue
 
-            # Sort by creation time (newest first)
-            tasks.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-            return tasks[:limit]
+            return tasks
 
         except Exception as e:
             logger.error(f"Failed to list tasks: {e}")
@@ -183,20 +238,17 @@ class HistoryManager:
             # Load config
             config_file = task_dir / "config.json"
             if config_file.exists():
-                with open(config_file, "r", encoding="utf-8") as f:
-                    details["config"] = json.load(f)
+                details["config"] = load_json(config_file)
 
             # Load rubrics
             rubrics_file = task_dir / "rubrics.txt"
             if rubrics_file.exists():
-                with open(rubrics_file, "r", encoding="utf-8") as f:
-                    details["rubrics"] = f.read()
+                details["rubrics"] = rubrics_file.read_text(encoding="utf-8")
 
             # Load grader config
             grader_file = task_dir / "grader.json"
             if grader_file.exists():
-                with open(grader_file, "r", encoding="utf-8") as f:
-                    details["grader_config"] = json.load(f)
+                details["grader_config"] = load_json(grader_file)
 
             return details
 
@@ -220,6 +272,7 @@ class HistoryManager:
 
         try:
             shutil.rmtree(task_dir)
+            self._config_cache.pop(task_dir / "config.json", None)
             logger.info(f"Deleted task: {task_id}")
             return True
         except Exception as e:
@@ -238,10 +291,21 @@ class HistoryManager:
         if not rubrics:
             return 0
 
-        # Count numbered items (1., 2., etc.) or "Rubric X:" patterns
-        import re
+        # Count matches without building the list of them
+        return sum(1 for _ in _RUBRIC_ITEM_RE.finditer(rubrics)) or 1
 
-        # Match patterns like "1.", "2." at line start or "Rubric 1:", "Rubric 2:"
-        pattern = r"(?:^\d+\.|^Rubric \d+:)"
-        matches = re.findall(pattern, rubrics, re.MULTILINE)
-        return len(matches) if matches else 1
+
+# Global history manager instance
+_history_manager: Optional[HistoryManager] = None
+
+
+def get_history_manager() -> HistoryManager:
+    """Get the global history manager instance.
+
+    Returns:
+        HistoryManager instance for the default history directory
+    """
+    global _history_manager
+    if _history_manager is None:
+        _history_manager = HistoryManager()
+    return _history_manager
@@ -8,10 +8,17 @@ Phase 1: Simple Rubric generation (zero-shot from task description)
 Phase 2: Iterative Rubric generation (data-driven from labeled data)
 """
 
+import asyncio
+import atexit
+import dataclasses
+import hashlib
+import time
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
+import httpx
 from loguru import logger
+from openai import AsyncOpenAI, RateLimitError
 
 from openjudge.generator.iterative_rubric.generator import (
     IterativeListwiseRubricsGeneratorConfig,
@@ -25,10 +32,17 @@ from openjudge.generator.simple_rubric import (
 from openjudge.graders.llm_grader import LLMGrader
 from openjudge.graders.schema import GraderMode
 from openjudge.models.openai_chat_model import OpenAIChatModel
+from openjudge.models.schema.oai.message import ChatMessage
 from openjudge.models.schema.prompt_template import LanguageEnum
 
+# Iterative generator config class per grader mode (pointwise is the default)
+_ITERATIVE_CONFIG_FACTORIES: dict[GraderMode, Callable[..., Any]] = {
+    GraderMode.POINTWISE: IterativePointwiseRubricsGeneratorConfig,
+    GraderMode.LISTWISE: IterativeListwiseRubricsGeneratorConfig,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class SimpleRubricConfig:
     """Configuration for Simple Rubric generation.
 
@@ -42,6 +56,8 @@ class SimpleRubricConfig:
         min_score: Minimum score for pointwise mode.
         max_score: Maximum score for pointwise mode.
         max_retries: Maximum retry attempts for LLM calls.
+        requests_per_minute: Optional request budget for the API key; None means unlimited.
+        tokens_per_minute: Optional estimated token budget for the API key; None means unlimited.
         api_endpoint: API endpoint URL.
         api_key: API key for authentication.
         model_name: Model name to use.
@@ -56,12 +72,14 @@ class SimpleRubricConfig:
     min_score: int = 0
     max_score: int = 5
     max_retries: int = 3
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
     api_endpoint: str = ""
     api_key: str = ""
     model_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of rubric generation.
 
@@ -80,6 +98,143 @@ class GenerationResult:
     grader_config: dict[str, Any] | None = None
 
 
+class AsyncRateLimiter:
+    """Token-bucket limiter for requests and tokens per minute.
+
+    Both buckets refill continuously; a limit of None leaves that bucket
+    unlimited. Callers wait in ``acquire`` until one request and the
+    estimated tokens are available. The limiter uses no loop-bound
+    primitives, so one instance can serve any event loop.
+    """
+
+    def __init__(self, requests_per_minute: float | None, tokens_per_minute: float | None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._available_requests = min(
+                self.requests_per_minute,
+                self._available_requests + elapsed_minutes * self.requests_per_minute,
+            )
+        if self.tokens_per_minute:
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed_minutes * self.tokens_per_minute,
+            )
+
+    def _wait_seconds(self, tokens: int) -> float:
+        """Seconds until one request and ``tokens`` tokens are available (0 if now)."""
+        wait_minutes = 0.0
+        if self.requests_per_minute:
+            wait_minutes = (1 - self._available_requests) / self.requests_per_minute
+        if self.tokens_per_minute:
+            wait_minutes = max(wait_minutes, (tokens - self._available_tokens) / self.tokens_per_minute)
+        return wait_minutes * 60
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and ``tokens`` tokens can be spent, then spend them."""
+        # A single oversized prompt must still be able to go through eventually
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            self._refill()
+            wait_seconds = self._wait_seconds(tokens)
+            if wait_seconds <= 0:
+                if self.requests_per_minute:
+                    self._available_requests -= 1
+                if self.tokens_per_minute:
+                    self._available_tokens -= tokens
+                return
+            await asyncio.sleep(max(wait_seconds, 0.001))
+
+    def backoff(self) -> None:
+        """Halve the remaining budget after the API reported a rate limit."""
+        self._available_requests /= 2
+        self._available_tokens /= 2
+
+
+def _estimate_tokens(messages: list[dict | ChatMessage]) -> int:
+    """Estimate prompt tokens on the high side, as one token per three UTF-8 bytes.
+
+    English runs at about four characters per token, while CJK characters
+    (three bytes each) are often a whole token, so counting bytes keeps the
+    estimate from undercounting non-Latin prompts.
+    """
+    size = 0
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else message.content
+        size += len(str(content or "").encode("utf-8"))
+    return -(-size // 3)
+
+
+def _validate_config(config: "SimpleRubricConfig | IterativeRubricConfig") -> str | None:
+    """Check the connection settings (and dataset) before any model is built.
+
+    Returns:
+        An error message, or None if the config is usable.
+    """
+    if not config.api_key:
+        return "API key is required"
+    if not config.model_name:
+        return "Model name is required"
+    if isinstance(config, IterativeRubricConfig) and not config.dataset:
+        return "Dataset is empty"
+    return None
+
+
+def _normalize_endpoint(endpoint: str) -> str:
+    """Add ``https://`` to an endpoint given without a scheme, e.g. ``api.openai.com/v1``.
+
+    An empty endpoint is kept, so the OpenAI client falls back to OPENAI_BASE_URL.
+    """
+    endpoint = endpoint.strip()
+    if endpoint and "://" not in endpoint:
+        return f"https://{endpoint}"
+    return endpoint
+
+
+class _RateLimitAwareClient(AsyncOpenAI):
+    """AsyncOpenAI client that leaves 429 responses to the AsyncRateLimiter.
+
+    Timeouts, connection errors and 5xx responses are still retried by the SDK.
+    """
+
+    def _should_retry(self, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return False
+        return super()._should_retry(response)
+
+
+class _RateLimitedChatModel(OpenAIChatModel):
+    """OpenAIChatModel whose calls pass through a shared AsyncRateLimiter."""
+
+    def __init__(self, *args: Any, rate_limiter: AsyncRateLimiter, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.client = _RateLimitAwareClient(
+            api_key=self.client.api_key,
+            base_url=self.client.base_url,
+            organization=self.client.organization,
+        )
+        self.rate_limiter = rate_limiter
+
+    async def achat(self, messages: list[dict | ChatMessage], *args: Any, **kwargs: Any) -> Any:
+        await self.rate_limiter.acquire(_estimate_tokens(messages))
+        try:
+            return await super().achat(messages, *args, **kwargs)
+        except RateLimitError:
+            # The SDK does not retry 429s for these models, so the generator's own
+            # retries come back through acquire() and wait on the drained buckets
+            self.rate_limiter.backoff()
+            raise
+
+
 class RubricGeneratorService:
     """Service for generating evaluation rubrics.
 
@@ -100,6 +255,53 @@ class RubricGeneratorService:
         ...     print(result.rubrics)
     """
 
+    def __init__(self) -> None:
+        # Rate limits apply per API key, so limiters are shared across generations
+        self._rate_limiters: dict[tuple[str, str, int | None, int | None], AsyncRateLimiter] = {}
+        # Chat models are reused so their HTTP connection pools survive between generations
+        self._models: dict[tuple[str, str, int | None, int | None, str], OpenAIChatModel] = {}
+
+    def _get_model(self, config: "SimpleRubricConfig | IterativeRubricConfig") -> OpenAIChatModel:
+        """Return the chat model for a generation, cached per endpoint and key.
+
+        Models are only rate-limited when the config sets a request or token
+        budget. Models and limiters are keyed by a digest of the API key
+        rather than the key itself.
+        """
+        key_digest = hashlib.blake2b(config.api_key.encode("utf-8"), digest_size=16).hexdigest()
+        limiter_key = (config.api_endpoint, key_digest, config.requests_per_minute, config.tokens_per_minute)
+        model_key = (*limiter_key, config.model_name)
+        model = self._models.get(model_key)
+        if model is not None:
+            return model
+
+        if config.requests_per_minute is None and config.tokens_per_minute is None:
+            model = OpenAIChatModel(
+                model=config.model_name,
+                base_url=config.api_endpoint,
+                api_key=config.api_key,
+            )
+        else:
+            rate_limiter = self._rate_limiters.get(limiter_key)
+            if rate_limiter is None:
+                rate_limiter = AsyncRateLimiter(config.requests_per_minute, config.tokens_per_minute)
+                self._rate_limiters[limiter_key] = rate_limiter
+            model = _RateLimitedChatModel(
+                model=config.model_name,
+                base_url=config.api_endpoint,
+                api_key=config.api_key,
+                rate_limiter=rate_limiter,
+            )
+        self._models[model_key] = model
+        return model
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients of all cached models."""
+        models = list(self._models.values())
+        self._models.clear()
+        for model in models:
+            await model.client.close()
+
     async def generate_simple(self, config: SimpleRubricConfig) -> GenerationResult:
         """Generate rubrics using Simple Rubric mode.
 
@@ -113,15 +315,16 @@ class RubricGeneratorService:
             GenerationResult with the generated grader and rubrics,
             or error information if generation failed.
         """
+        error = _validate_config(config)
+        if error:
+            return GenerationResult(success=False, error=error)
+        config = dataclasses.replace(config, api_endpoint=_normalize_endpoint(config.api_endpoint))
+
         try:
             logger.info(f"Starting Simple Rubric generation for '{config.grader_name}'")
 
             # Create the model instance
-            model = OpenAIChatModel(
-                model=config.model_name,
-                base_url=config.api_endpoint,
-                api_key=config.api_key,
-            )
+            model = self._get_model(config)
 
             # Create generator config
             generator_config = SimpleRubricsGeneratorConfig(
@@ -195,6 +398,11 @@ class RubricGeneratorService:
             GenerationResult with the generated grader and rubrics,
             or error information if generation failed.
         """
+        error = _validate_config(config)
+        if error:
+            return GenerationResult(success=False, error=error)
+        config = dataclasses.replace(config, api_endpoint=_normalize_endpoint(config.api_endpoint))
+
         try:
             logger.info(f"Starting Iterative Rubric generation for '{config.grader_name}'")
 
@@ -202,47 +410,40 @@ class RubricGeneratorService:
                 progress_callback("init", 0.0)
 
             # Create the model instance
-            model = OpenAIChatModel(
-                model=config.model_name,
-                base_url=config.api_endpoint,
-                api_key=config.api_key,
-            )
+            model = self._get_model(config)
 
             if progress_callback:
                 progress_callback("init", 0.1)
 
             # Create generator config based on grader_mode
-            if config.grader_mode == GraderMode.LISTWISE:
-                generator_config = IterativeListwiseRubricsGeneratorConfig(
-                    grader_name=config.grader_name,
-                    model=model,
-                    language=config.language,
-                    enable_categorization=config.enable_categorization,
-                    categories_number=config.categories_number,
-                    query_specific_generate_number=config.query_specific_generate_number,
-                    task_description=config.task_description,
-                    max_retries=config.max_retries,
-                )
-            else:
-                # Default to Pointwise mode
-                generator_config = IterativePointwiseRubricsGeneratorConfig(
-                    grader_name=config.grader_name,
-                    model=model,
-                    language=config.language,
-                    min_score=config.min_score,
-                    max_score=config.max_score,
-                    enable_categorization=config.enable_categorization,
-                    categories_number=config.categories_number,
-                    query_specific_generate_number=config.query_specific_generate_number,
-                    task_description=config.task_description,
-                    max_retries=config.max_retries,
-                )
+            config_kwargs: dict[str, Any] = {
+                "grader_name": config.grader_name,
+                "model": model,
+                "language": config.language,
+                "enable_categorization": config.enable_categorization,
+                "categories_number": config.categories_number,
+                "query_specific_generate_number": config.query_specific_generate_number,
+                "task_description": config.task_description,
+                "max_retries": config.max_retries,
+                "max_concurrency": config.max_concurrency,
+            }
+            if config.grader_mode != GraderMode.LISTWISE:
+                config_kwargs["min_score"] = config.min_score
+                config_kwargs["max_score"] = config.max_score
+            config_factory = _ITERATIVE_CONFIG_FACTORIES.get(
+                config.grader_mode, IterativePointwiseRubricsGeneratorConfig
+            )
+            generator_config = config_factory(**config_kwargs)
 
             if progress_callback:
                 progress_callback("generating", 0.2)
 
-            # Create generator and generate
-            generator = IterativeRubricsGenerator(generator_config)
+            # Create generator and generate, reporting progress per training sample
+            def on_sample_complete(done: int, total: int) -> None:
+                if progress_callback:
+                    progress_callback("generating", 0.2 + 0.7 * min(done / total, 1.0))
+
+            generator = IterativeRubricsGenerator(generator_config, on_sample_complete=on_sample_complete)
             grader = await generator.generate(dataset=config.dataset)
 
             if progress_callback:
@@ -343,7 +544,7 @@ class RubricGeneratorService:
             # Build kwargs for listwise evaluation
             # The grader template expects 'responses' as formatted string and 'num_responses'
             # Format: "Response 1:\n{content}\n\nResponse 2:\n{content}\n\n..."
-            responses_text = "\n\n".join([f"Response {i + 1}:\n{resp}" for i, resp in enumerate(responses)])
+            responses_text = "\n\n".join(f"Response {i}:\n{resp}" for i, resp in enumerate(responses, 1))
 
             result = await grader.aevaluate(
                 query=query,
@@ -364,7 +565,7 @@ class RubricGeneratorService:
             }
 
 
-@dataclass
+@dataclass(slots=True)
 class IterativeRubricConfig:
     """Configuration for Iterative Rubric generation.
 
@@ -380,6 +581,9 @@ class IterativeRubricConfig:
         categories_number: Target number of categories.
         query_specific_generate_number: Rubrics per training sample.
         max_retries: Maximum retry attempts for LLM calls.
+        max_concurrency: Maximum training samples processed concurrently.
+        requests_per_minute: Optional request budget for the API key; None means unlimited.
+        tokens_per_minute: Optional estimated token budget for the API key; None means unlimited.
         api_endpoint: API endpoint URL.
         api_key: API key for authentication.
         model_name: Model name to use.
@@ -396,6 +600,37 @@ class IterativeRubricConfig:
     categories_number: int = 5
     query_specific_generate_number: int = 2
     max_retries: int = 3
+    max_concurrency: int = 32
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
     api_endpoint: str = ""
     api_key: str = ""
     model_name: str = ""
+
+
+# Global rubric generator service instance
+_rubric_generator_service: Optional[RubricGeneratorService] = None
+
+
+def get_rubric_generator_service() -> RubricGeneratorService:
+    """Get the global rubric generator service instance.
+
+    Returns:
+        RubricGeneratorService instance shared across reruns
+    """
+    global _rubric_generator_service
+    if _rubric_generator_service is None:
+        _rubric_generator_service = RubricGeneratorService()
+        atexit.register(_close_rubric_generator_service)
+    return _rubric_generator_service
+
+
+def _close_rubric_generator_service() -> None:
+    """Drain pooled connections of the global service on interpreter exit."""
+    from shared.utils.helpers import submit_async
+
+    if _rubric_generator_service is not None:
+        try:
+            submit_async(_rubric_generator_service.aclose()).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Failed to close rubric generator models: {e}")
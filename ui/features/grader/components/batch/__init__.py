@@ -2,6 +2,7 @@
 """Batch evaluation UI components for Grader feature."""
 
 from features.grader.components.batch.batch_history_panel import (
+    clear_batch_history_cache,
     render_batch_history_panel,
 )
 from features.grader.components.batch.batch_progress_panel import (
@@ -17,4 +18,5 @@ __all__ = [
     "render_batch_progress_panel",
     "render_batch_result_panel",
     "render_batch_history_panel",
+    "clear_batch_history_cache",
 ]
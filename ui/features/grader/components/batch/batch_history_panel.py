@@ -5,27 +5,51 @@ Displays past batch evaluation tasks with options to view, resume, or delete.
 """
 
 from datetime import datetime
-from typing import Callable
+from functools import lru_cache
+from typing import Any, Callable
 
 import streamlit as st
+from features.grader.components.batch.batch_result_panel import (
+    clear_batch_result_cache,
+    render_batch_result_panel,
+)
 from features.grader.services.batch_history_manager import (
-    BatchHistoryManager,
     BatchTaskSummary,
+    get_batch_history_manager,
 )
 from shared.i18n import get_ui_language, t
 
 
-def _format_time_ago(dt: datetime) -> str:
+@st.cache_data(ttl=5, show_spinner=False)
+def _list_tasks(limit: int) -> list[BatchTaskSummary]:
+    """List recent tasks, cached briefly across reruns."""
+    return get_batch_history_manager().list_tasks(limit=limit)
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _get_task_details(task_id: str) -> dict[str, Any] | None:
+    """Load task details, cached briefly across reruns."""
+    return get_batch_history_manager().get_task_details(task_id)
+
+
+def clear_batch_history_cache() -> None:
+    """Drop cached task listings, details and results after tasks change on disk."""
+    _list_tasks.clear()
+    _get_task_details.clear()
+    clear_batch_result_cache()
+
+
+def _format_time_ago(dt: datetime, now: datetime | None = None) -> str:
     """Format datetime as relative time string.
 
     Args:
         dt: Datetime to format
+        now: Reference time (defaults to the current time)
 
     Returns:
         Human-readable time ago string
     """
-    now = datetime.now()
-    diff = now - dt
+    diff = (now or datetime.now()) - dt
 
     if diff.days > 30:
         return dt.strftime("%Y-%m-%d")
@@ -41,79 +65,103 @@ def _format_time_ago(dt: datetime) -> str:
         return "Just now"
 
 
-def _get_status_style(status: str) -> dict[str, str]:
+# Task states that can still be resumed
+_INCOMPLETE_STATES = frozenset({"paused", "running"})
+
+# Static status styling: (color, background, icon, i18n key)
+_STATUS_STYLES: dict[str, tuple[str, str, str, str]] = {
+    "completed": ("#10B981", "rgba(16, 185, 129, 0.1)", "✓", "status.completed"),
+    "failed": ("#EF4444", "rgba(239, 68, 68, 0.1)", "✕", "status.failed"),
+    "running": ("#6366F1", "rgba(99, 102, 241, 0.1)", "●", "status.running"),
+    "paused": ("#F59E0B", "rgba(245, 158, 11, 0.1)", "⏸", "status.paused"),
+    "pending": ("#64748B", "rgba(100, 116, 139, 0.1)", "○", "status.pending"),
+}
+
+
+@lru_cache(maxsize=32)
+def _get_status_style(status: str, lang: str) -> tuple[str, str, str, str]:
     """Get status styling.
 
     Args:
         status: Task status string
+        lang: UI language, so cached labels follow language switches
 
     Returns:
-        Style dictionary with color, bg, icon, text
+        Tuple of (color, bg, icon, text)
     """
-    status_styles = {
-        "completed": {
-            "color": "#10B981",
-            "bg": "rgba(16, 185, 129, 0.1)",
-            "icon": "✓",
-            "text": t("status.completed"),
-        },
-        "failed": {
-            "color": "#EF4444",
-            "bg": "rgba(239, 68, 68, 0.1)",
-            "icon": "✕",
-            "text": t("status.failed"),
-        },
-        "running": {
-            "color": "#6366F1",
-            "bg": "rgba(99, 102, 241, 0.1)",
-            "icon": "●",
-            "text": t("status.running"),
-        },
-        "paused": {
-            "color": "#F59E0B",
-            "bg": "rgba(245, 158, 11, 0.1)",
-            "icon": "⏸",
-            "text": t("status.paused"),
-        },
-        "pending": {
-            "color": "#64748B",
-            "bg": "rgba(100, 116, 139, 0.1)",
-            "icon": "○",
-            "text": t("status.pending"),
-        },
-    }
-    return status_styles.get(status, status_styles["pending"])
+    color, bg, icon, text_key = _STATUS_STYLES.get(status, _STATUS_STYLES["pending"])
+    return color, bg, icon, t(text_key)
 
 
-def _render_task_card(
-    task: BatchTaskSummary,
-    on_view: Callable[[str], None] | None = None,
-    on_resume: Callable[[str], None] | None = None,
-    on_delete: Callable[[str], None] | None = None,
-) -> None:
-    """Render a single task card.
+# Static panel markup; only the translated text is substituted
+_HEADER_HTML = """<div class="section-header">
+            <span style="margin-right: 0.5rem;">📜</span>{title}
+        </div>"""
 
-    Args:
-        task: Task summary to display
-        on_view: Callback when view button clicked
-        on_resume: Callback when resume button clicked
-        on_delete: Callback when delete button clicked
-    """
-    style = _get_status_style(task.status)
+_EMPTY_STATE_HTML = """<div style="
+                text-align: center;
+                padding: 2rem;
+                color: #64748B;
+                background: rgba(30, 41, 59, 0.3);
+                border-radius: 8px;
+            ">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📭</div>
+                <div style="font-size: 0.9rem;">
+                    {message}
+                </div>
+                <div style="font-size: 0.8rem; margin-top: 0.5rem;">
+                    {hint}
+                </div>
+            </div>"""
 
-    # Progress percentage
-    progress_pct = (task.completed_count / task.total_count * 100) if task.total_count > 0 else 0
+_INCOMPLETE_WARNING_HTML = """<div style="
+                background: rgba(245, 158, 11, 0.1);
+                border: 1px solid rgba(245, 158, 11, 0.3);
+                border-radius: 8px;
+                padding: 0.75rem 1rem;
+                margin-bottom: 1rem;
+                font-size: 0.85rem;
+            ">
+                <span style="color: #F59E0B;">⚠️</span>
+                <span style="color: #FCD34D;">
+                    {message}
+                </span>
+            </div>"""
 
-    # Stats display
-    stats_parts = [f"{task.total_count} items"]
-    if task.avg_score is not None:
-        stats_parts.append(f"Avg: {task.avg_score:.2f}")
-    if task.pass_rate is not None:
-        stats_parts.append(f"Pass: {task.pass_rate * 100:.0f}%")
+_COUNT_FOOTER_HTML = """<div style="text-align: center; font-size: 0.75rem; color: #64748B; margin-top: 0.5rem;">
+            {message}
+        </div>"""
 
-    # Card container
-    st.markdown(
-        f"""<div style="
+
+@lru_cache(maxsize=8)
+def _header_html(lang: str) -> str:
+    """Build the panel header for a UI language."""
+    return _HEADER_HTML.format(title=t("grader.batch.history_title"))
+
+
+@lru_cache(maxsize=8)
+def _empty_state_html(lang: str) -> str:
+    """Build the empty-history placeholder for a UI language."""
+    return _EMPTY_STATE_HTML.format(
+        message=t("grader.batch.history_empty"),
+        hint=t("grader.batch.history_empty_hint"),
+    )
+
+
+@lru_cache(maxsize=64)
+def _incomplete_warning_html(count: int, lang: str) -> str:
+    """Build the incomplete-tasks warning for a task count and UI language."""
+    return _INCOMPLETE_WARNING_HTML.format(message=t("grader.batch.incomplete_tasks", count=count))
+
+
+@lru_cache(maxsize=64)
+def _count_footer_html(count: int, lang: str) -> str:
+    """Build the task count footer for a task count and UI language."""
+    return _COUNT_FOOTER_HTML.format(message=t("grader.batch.history_count", count=count))
+
+
+# Task card markup; filled in per task by _card_html
+_CARD_HTML = """<div style="
             background: rgba(30, 41, 59, 0.5);
             border: 1px solid rgba(100, 116, 139, 0.2);
             border-radius: 8px;
@@ -128,14 +176,14 @@ def _render_task_card(
                             align-items: center;
                             gap: 0.25rem;
                             padding: 0.125rem 0.5rem;
-                            background: {style['bg']};
-                            color: {style['color']};
+                            background: {bg};
+                            color: {color};
                             border-radius: 4px;
                             font-size: 0.7rem;
                             font-weight: 600;
-                        ">{style['icon']} {style['text']}</span>
+                        ">{icon} {text}</span>
                         <span style="font-size: 0.75rem; color: #64748B;">
-                            {_format_time_ago(task.created_at)}
+                            {time_ago}
                         </span>
                     </div>
                     <div style="
@@ -144,20 +192,20 @@ def _render_task_card(
                         font-size: 0.9rem;
                         margin-bottom: 0.25rem;
                     ">
-                        {task.grader_name_zh if get_ui_language() == "zh" else task.grader_name}
+                        {name}
                     </div>
                     <div style="font-size: 0.75rem; color: #94A3B8;">
-                        {' • '.join(stats_parts)}
+                        {stats}
                     </div>
                 </div>
                 <div style="text-align: right; min-width: 60px;">
                     <div style="
                         font-size: 1.25rem;
                         font-weight: 700;
-                        color: {style['color']};
+                        color: {color};
                     ">{progress_pct:.0f}%</div>
                     <div style="font-size: 0.65rem; color: #64748B;">
-                        {task.completed_count}/{task.total_count}
+                        {completed_count}/{total_count}
                     </div>
                 </div>
             </div>
@@ -172,7 +220,7 @@ def _render_task_card(
                 <div style="
                     width: {progress_pct}%;
                     height: 100%;
-                    background: {style['color']};
+                    background: {color};
                 "></div>
             </div>
             <!-- Success/Failed counts -->
@@ -182,24 +230,93 @@ def _render_task_card(
                 margin-top: 0.5rem;
                 font-size: 0.7rem;
             ">
-                <span style="color: #10B981;">✓ {task.success_count} success</span>
-                <span style="color: #EF4444;">✕ {task.failed_count} failed</span>
+                <span style="color: #10B981;">✓ {success_count} success</span>
+                <span style="color: #EF4444;">✕ {failed_count} failed</span>
             </div>
-        </div>""",
-        unsafe_allow_html=True,
+        </div>"""
+
+
+def _card_html(task: BatchTaskSummary, lang: str, now: datetime | None = None) -> str:
+    """Build the HTML for a single task card.
+
+    Args:
+        task: Task summary to display
+        lang: Current UI language
+        now: Reference time for the relative timestamp
+
+    Returns:
+        Card HTML string
+    """
+    color, bg, icon, text = _get_status_style(task.status, lang)
+
+    # Progress percentage
+    progress_pct = (task.completed_count / task.total_count * 100) if task.total_count > 0 else 0
+
+    # Stats display
+    stats_parts = [f"{task.total_count} items"]
+    if task.avg_score is not None:
+        stats_parts.append(f"Avg: {task.avg_score:.2f}")
+    if task.pass_rate is not None:
+        stats_parts.append(f"Pass: {task.pass_rate * 100:.0f}%")
+
+    return _CARD_HTML.format(
+        bg=bg,
+        color=color,
+        icon=icon,
+        text=text,
+        time_ago=_format_time_ago(task.created_at, now),
+        name=task.grader_name_zh if lang == "zh" else task.grader_name,
+        stats=" • ".join(stats_parts),
+        progress_pct=progress_pct,
+        completed_count=task.completed_count,
+        total_count=task.total_count,
+        success_count=task.success_count,
+        failed_count=task.failed_count,
     )
 
+
+@lru_cache(maxsize=8)
+def _action_labels(lang: str) -> tuple[str, str, str]:
+    """Get the (view, resume, delete) button labels for a UI language."""
+    return (
+        f"👁️ {t('grader.batch.view')}",
+        f"▶️ {t('grader.batch.resume')}",
+        f"🗑️ {t('grader.batch.delete')}",
+    )
+
+
+def _render_task_card(
+    task: BatchTaskSummary,
+    card_html: str,
+    lang: str,
+    on_view: Callable[[str], None] | None = None,
+    on_resume: Callable[[str], None] | None = None,
+    on_delete: Callable[[str], None] | None = None,
+) -> None:
+    """Render a single task card.
+
+    Args:
+        task: Task summary to display
+        card_html: Pre-built card HTML from ``_card_html``
+        lang: Current UI language
+        on_view: Callback when view button clicked
+        on_resume: Callback when resume button clicked
+        on_delete: Callback when delete button clicked
+    """
+    st.markdown(card_html, unsafe_allow_html=True)
+
     # Action buttons
+    view_label, resume_label, delete_label = _action_labels(lang)
     col1, col2, col3 = st.columns(3)
     with col1:
-        if st.button(f"👁️ {t('grader.batch.view')}", key=f"batch_view_{task.task_id}", use_container_width=True):
+        if st.button(view_label, key=f"batch_view_{task.task_id}", use_container_width=True):
             if on_view:
                 on_view(task.task_id)
 
     with col2:
-        can_resume = task.status in ("paused", "running") and task.completed_count < task.total_count
+        can_resume = task.status in _INCOMPLETE_STATES and task.completed_count < task.total_count
         if st.button(
-            f"▶️ {t('grader.batch.resume')}",
+            resume_label,
             key=f"batch_resume_{task.task_id}",
             use_container_width=True,
             disabled=not can_resume,
@@ -208,7 +325,7 @@ def _render_task_card(
                 on_resume(task.task_id)
 
     with col3:
-        if st.button(f"🗑️ {t('grader.batch.delete')}", key=f"batch_delete_{task.task_id}", use_container_width=True):
+        if st.button(delete_label, key=f"batch_delete_{task.task_id}", use_container_width=True):
             if on_delete:
                 on_delete(task.task_id)
 
@@ -227,69 +344,34 @@ def render_batch_history_panel(
         on_delete: Callback when delete button clicked (receives task_id)
         limit: Maximum number of tasks to show
     """
-    st.markdown(
-        f"""<div class="section-header">
-            <span style="margin-right: 0.5rem;">📜</span>{t("grader.batch.history_title")}
-        </div>""",
-        unsafe_allow_html=True,
-    )
+    lang = get_ui_language()
+    st.markdown(_header_html(lang), unsafe_allow_html=True)
 
     # Load history
-    history_manager = BatchHistoryManager()
-    tasks = history_manager.list_tasks(limit=limit)
+    tasks = _list_tasks(limit)
 
     if not tasks:
-        st.markdown(
-            f"""<div style="
-                text-align: center;
-                padding: 2rem;
-                color: #64748B;
-                background: rgba(30, 41, 59, 0.3);
-                border-radius: 8px;
-            ">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📭</div>
-                <div style="font-size: 0.9rem;">
-                    {t("grader.batch.history_empty")}
-                </div>
-                <div style="font-size: 0.8rem; margin-top: 0.5rem;">
-                    {t("grader.batch.history_empty_hint")}
-                </div>
-            </div>""",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_empty_state_html(lang), unsafe_allow_html=True)
         return
 
-    # Check for incomplete tasks
-    incomplete_tasks = [task for task in tasks if task.status in ("paused", "running")]
-    if incomplete_tasks:
-        st.markdown(
-            f"""<div style="
-                background: rgba(245, 158, 11, 0.1);
-                border: 1px solid rgba(245, 158, 11, 0.3);
-                border-radius: 8px;
-                padding: 0.75rem 1rem;
-                margin-bottom: 1rem;
-                font-size: 0.85rem;
-            ">
-                <span style="color: #F59E0B;">⚠️</span>
-                <span style="color: #FCD34D;">
-                    {t("grader.batch.incomplete_tasks", count=len(incomplete_tasks))}
-                </span>
-            </div>""",
-            unsafe_allow_html=True,
-        )
+    # Build every card and count incomplete tasks in a single pass
+    now = datetime.now()
+    cards: list[tuple[BatchTaskSummary, str]] = []
+    incomplete_count = 0
+    for task in tasks:
+        cards.append((task, _card_html(task, lang, now)))
+        if task.status in _INCOMPLETE_STATES:
+            incomplete_count += 1
+
+    if incomplete_count:
+        st.markdown(_incomplete_warning_html(incomplete_count, lang), unsafe_allow_html=True)
 
     # Render task cards
-    for task in tasks:
-        _render_task_card(task, on_view, on_resume, on_delete)
+    for task, card_html in cards:
+        _render_task_card(task, card_html, lang, on_view, on_resume, on_delete)
 
     # Show count
-    st.markdown(
-        f"""<div style="text-align: center; font-size: 0.75rem; color: #64748B; margin-top: 0.5rem;">
-            {t("grader.batch.history_count", count=len(tasks))}
-        </div>""",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_count_footer_html(len(tasks), lang), unsafe_allow_html=True)
 
 
 def render_batch_task_detail(
@@ -302,8 +384,8 @@ def render_batch_task_detail(
         task_id: Task ID to display
         on_back: Callback when back button clicked
     """
-    history_manager = BatchHistoryManager()
-    details = history_manager.get_task_details(task_id)
+    history_manager = get_batch_history_manager()
+    details = _get_task_details(task_id)
 
     if not details:
         st.error(f"{t('grader.batch.task_not_found')}: {task_id}")
@@ -347,11 +429,6 @@ def render_batch_task_detail(
         unsafe_allow_html=True,
     )
 
-    # Import and render result panel
-    from features.grader.components.batch.batch_result_panel import (
-        render_batch_result_panel,
-    )
-
     # Get score range from grader config
     grader_config = config.get("grader_config", {})
     score_range = grader_config.get("score_range", (0, 1))
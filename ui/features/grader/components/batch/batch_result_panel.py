@@ -8,203 +8,372 @@ Displays:
 - Export functionality
 """
 
+import hashlib
+import html
+import json
+from functools import lru_cache
 from typing import Any
 
+import altair as alt
+import numpy as np
+import pandas as pd
 import streamlit as st
-from features.grader.services.batch_history_manager import BatchHistoryManager
+from features.grader.services.batch_history_manager import (
+    BatchHistoryManager,
+    get_batch_history_manager,
+)
 from shared.components.common import render_section_header
 from shared.styles.theme import get_score_color
+from shared.utils.json_io import dump_json
 
 
-def _render_summary_cards(summary: dict[str, Any], score_range: tuple[float, float]) -> None:
-    """Render summary statistics cards."""
-    avg_score = summary.get("avg_score")
-    pass_rate = summary.get("pass_rate")
-    total_count = summary.get("total_count", 0)
-    success_count = summary.get("success_count", 0)
-    failed_count = summary.get("failed_count", 0)
-    passed_count = summary.get("passed_count", 0)
+# The manager is excluded from the cache key (leading underscore); its base
+# directory is hashed instead so different history roots never collide.
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_task_results(_history_manager: BatchHistoryManager, base_dir: str, task_id: str) -> list[dict[str, Any]]:
+    """Load a task's results, cached across reruns."""
+    return _history_manager.get_task_results(task_id) or []
 
-    col1, col2, col3 = st.columns(3)
 
-    with col1:
-        if avg_score is not None:
-            score_color = get_score_color(avg_score, score_range[1])
-            score_display = f"{avg_score:.2f}"
-        else:
-            score_color = "#64748B"
-            score_display = "--"
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_task_summary(_history_manager: BatchHistoryManager, base_dir: str, task_id: str) -> dict[str, Any]:
+    """Load a task's summary, cached across reruns."""
+    details = _history_manager.get_task_details(task_id)
+    return details.get("summary", {}) if details else {}
 
-        st.markdown(
-            f"""<div style="
-                background: linear-gradient(135deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9));
-                border: 1px solid #334155;
-                border-radius: 12px;
-                padding: 1.25rem;
-                text-align: center;
-            ">
-                <div style="font-size: 2rem; font-weight: 700; color: {score_color};">
-                    {score_display}
-                </div>
-                <div style="font-size: 0.75rem; color: #64748B; text-transform: uppercase;">
-                    / {score_range[1]}
-                </div>
-                <div style="font-size: 0.8rem; color: #94A3B8; margin-top: 0.5rem;">
-                    Avg Score / 平均分
-                </div>
-            </div>""",
-            unsafe_allow_html=True,
-        )
 
-    with col2:
-        if pass_rate is not None:
-            rate_pct = pass_rate * 100
-            rate_color = "#10B981" if rate_pct >= 80 else "#F59E0B" if rate_pct >= 50 else "#EF4444"
-            rate_display = f"{rate_pct:.1f}%"
-        else:
-            rate_color = "#64748B"
-            rate_display = "--"
+@st.cache_data(ttl=60, show_spinner=False)
+def _export_results(
+    _history_manager: BatchHistoryManager, base_dir: str, task_id: str, format_type: str
+) -> bytes | None:
+    """Serialize a task's results for download, cached across reruns."""
+    return _history_manager.export_results(task_id, format_type)
 
-        st.markdown(
-            f"""<div style="
+
+def _results_digest(results: list[dict[str, Any]]) -> str:
+    """Digest the fields and order of the results that ``_results_frame`` reads.
+
+    The same task can arrive in index order (a finished run) or completion
+    order (results.json), so the digest covers order as well as content.
+    """
+    fields = [(r.get("index", 0), r.get("score"), r.get("passed"), r.get("status")) for r in results]
+    return hashlib.blake2b(dump_json(fields, indent=False, default=str), digest_size=16).hexdigest()
+
+
+# Results are excluded from the cache key; the digest from _results_digest
+# stands in for them.
+@st.cache_data(max_entries=8, show_spinner=False)
+def _results_frame(digest: str, _results: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the columns used to filter and sort results.
+
+    The frame's row labels are positions in ``_results``, so selected rows
+    map straight back to the full result records. Scores stay float64 so
+    histogram bin edges such as 0.7 compare exactly as before.
+    """
+    return pd.DataFrame(
+        {
+            "index": np.array([r.get("index", 0) for r in _results], dtype=np.int32),
+            "score": np.array([r.get("score") for r in _results], dtype=np.float64),
+            "passed": pd.array([r.get("passed") for r in _results], dtype="boolean"),
+            "status": pd.Categorical([r.get("status") for r in _results]),
+        }
+    )
+
+
+# Session state key prefix for per-task panel views (see _results_view)
+_VIEW_STATE_PREFIX = "batch_result_view_"
+
+
+def clear_batch_result_cache() -> None:
+    """Drop cached task results, summaries, exports and views after tasks change on disk."""
+    _get_task_results.clear()
+    _get_task_summary.clear()
+    _export_results.clear()
+    _results_frame.clear()
+    for key in [k for k in st.session_state if str(k).startswith(_VIEW_STATE_PREFIX)]:
+        del st.session_state[key]
+
+
+@lru_cache(maxsize=1024)
+def _cached_score_color(score: float, max_score: float) -> str:
+    """Memoized get_score_color."""
+    return get_score_color(score, max_score)
+
+
+def _score_color(score: float, max_score: float) -> str:
+    """Get the colour for a score, rounded to the two decimals that are displayed."""
+    return _cached_score_color(round(score, 2), max_score)
+
+
+# Summary card markup; each card fills in its value, detail line and label
+_SUMMARY_CARD_HTML = """<div style="
                 background: linear-gradient(135deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9));
                 border: 1px solid #334155;
                 border-radius: 12px;
                 padding: 1.25rem;
+                margin-bottom: 1rem;
                 text-align: center;
             ">
-                <div style="font-size: 2rem; font-weight: 700; color: {rate_color};">
-                    {rate_display}
-                </div>
+                {value}
                 <div style="font-size: 0.75rem; color: #64748B;">
-                    {passed_count} / {success_count}
+                    {detail}
                 </div>
                 <div style="font-size: 0.8rem; color: #94A3B8; margin-top: 0.5rem;">
-                    Pass Rate / 通过率
+                    {label}
                 </div>
-            </div>""",
-            unsafe_allow_html=True,
-        )
+            </div>"""
 
-    with col3:
-        st.markdown(
-            f"""<div style="
-                background: linear-gradient(135deg, rgba(30, 41, 59, 0.8), rgba(15, 23, 42, 0.9));
-                border: 1px solid #334155;
-                border-radius: 12px;
-                padding: 1.25rem;
-                text-align: center;
-            ">
-                <div style="font-size: 1.5rem; font-weight: 700;">
+_METRIC_VALUE_HTML = """<div style="font-size: 2rem; font-weight: 700; color: {color};">
+                    {text}
+                </div>"""
+
+_COUNTS_VALUE_HTML = """<div style="font-size: 1.5rem; font-weight: 700;">
                     <span style="color: #10B981;">{success_count}</span>
                     <span style="color: #64748B;"> / </span>
                     <span style="color: #EF4444;">{failed_count}</span>
-                </div>
-                <div style="font-size: 0.75rem; color: #64748B;">
-                    of {total_count} total
-                </div>
-                <div style="font-size: 0.8rem; color: #94A3B8; margin-top: 0.5rem;">
-                    Success / Failed
-                </div>
-            </div>""",
-            unsafe_allow_html=True,
-        )
+                </div>"""
 
 
-def _render_score_distribution(results: list[dict[str, Any]], score_range: tuple[float, float]) -> None:
-    """Render score distribution chart."""
-    # Extract scores
-    scores = [r.get("score") for r in results if r.get("status") == "success" and r.get("score") is not None]
+def _render_summary_cards(summary: dict[str, Any], score_range: tuple[float, float]) -> None:
+    """Render summary statistics cards."""
+    avg_score = summary.get("avg_score")
+    pass_rate = summary.get("pass_rate")
+    total_count = summary.get("total_count", 0)
+    success_count = summary.get("success_count", 0)
+    failed_count = summary.get("failed_count", 0)
+    passed_count = summary.get("passed_count", 0)
 
-    if not scores:
-        return
+    if avg_score is not None:
+        score_color = _score_color(avg_score, score_range[1])
+        score_display = f"{avg_score:.2f}"
+    else:
+        score_color = "#64748B"
+        score_display = "--"
+
+    if pass_rate is not None:
+        rate_pct = pass_rate * 100
+        rate_color = "#10B981" if rate_pct >= 80 else "#F59E0B" if rate_pct >= 50 else "#EF4444"
+        rate_display = f"{rate_pct:.1f}%"
+    else:
+        rate_color = "#64748B"
+        rate_display = "--"
+
+    cards = (
+        _SUMMARY_CARD_HTML.format(
+            value=_METRIC_VALUE_HTML.format(color=score_color, text=score_display),
+            detail=f"/ {score_range[1]}",
+            label="Avg Score / 平均分",
+        ),
+        _SUMMARY_CARD_HTML.format(
+            value=_METRIC_VALUE_HTML.format(color=rate_color, text=rate_display),
+            detail=f"{passed_count} / {success_count}",
+            label="Pass Rate / 通过率",
+        ),
+        _SUMMARY_CARD_HTML.format(
+            value=_COUNTS_VALUE_HTML.format(success_count=success_count, failed_count=failed_count),
+            detail=f"of {total_count} total",
+            label="Success / Failed",
+        ),
+    )
+
+    for column, card_html in zip(st.columns(3), cards):
+        with column:
+            st.markdown(card_html, unsafe_allow_html=True)
+
+
+def _success_scores(frame: pd.DataFrame) -> np.ndarray:
+    """Get the scores of successful results from the results frame."""
+    return frame.loc[frame["status"].eq("success"), "score"].dropna().to_numpy()
+
+
+def _summarize_results(frame: pd.DataFrame, scores: np.ndarray) -> dict[str, Any]:
+    """Derive summary statistics from the results frame.
+
+    Mirrors ``BatchRunner.get_summary``: the pass rate is taken over
+    successful results that have a score.
+    """
+    success_count = int(frame["status"].eq("success").sum())
+    passed_count = int(frame["passed"].eq(True).fillna(False).sum())
+    return {
+        "total_count": len(frame),
+        "completed_count": len(frame),
+        "success_count": success_count,
+        "failed_count": len(frame) - success_count,
+        "avg_score": float(scores.mean()) if scores.size else None,
+        "pass_rate": passed_count / scores.size if scores.size else None,
+        "passed_count": passed_count,
+    }
+
+
+def _score_histogram(scores: np.ndarray, score_range: tuple[float, float]) -> pd.DataFrame | None:
+    """Bin the successful results' scores into (bin label, count) rows."""
+    if not scores.size:
+        return None
 
     # Create histogram data
     min_score, max_score = score_range
     num_bins = 10 if max_score <= 1 else 5
 
     if max_score <= 1:
-        bins = [i / num_bins for i in range(num_bins + 1)]
+        bin_edges = np.arange(num_bins + 1) / num_bins
     else:
-        bins = list(range(int(min_score), int(max_score) + 2))
-
-    # Count scores in each bin
-    counts = [0] * (len(bins) - 1)
-    for score in scores:
-        for i in range(len(bins) - 1):
-            if bins[i] <= score < bins[i + 1]:
-                counts[i] += 1
-                break
-        else:
-            # Handle max value
-            if score == bins[-1]:
-                counts[-1] += 1
-
-    # Create bar chart using HTML/CSS
-    max_count = max(counts) if counts else 1
-    bar_width = 100 / len(counts)
-
-    bars_html = ""
-    for i, count in enumerate(counts):
-        height_pct = (count / max_count * 100) if max_count > 0 else 0
-        label = f"{bins[i]:.1f}" if max_score <= 1 else f"{int(bins[i])}"
-
-        bars_html += f"""<br>
-            <div style="
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                width: {bar_width}%;
-            ">
-                <div style="
-                    height: 60px;
-                    width: 80%;
-                    display: flex;
-                    align-items: flex-end;
-                ">
-                    <div style="
-                        width: 100%;
-                        height: {height_pct}%;
-                        background: linear-gradient(180deg, #6366F1, #4F46E5);
-                        border-radius: 4px 4px 0 0;
-                        min-height: {2 if count > 0 else 0}px;
-                    "></div>
-                </div>
-                <div style="font-size: 0.65rem; color: #64748B; margin-top: 0.25rem;">
-                    {label}
-                </div>
-                <div style="font-size: 0.6rem; color: #94A3B8;">
-                    {count}
-                </div>
-            </div>"""
+        bin_edges = np.arange(int(min_score), int(max_score) + 2, dtype=np.float64)
+
+    # Count scores in each bin; the last bin includes its upper edge
+    counts = np.histogram(scores, bins=bin_edges)[0]
+    labels = [f"{edge:.1f}" if max_score <= 1 else f"{int(edge)}" for edge in bin_edges[:-1]]
+    return pd.DataFrame({"bin": labels, "count": counts})
 
+
+def _render_score_distribution(chart_data: pd.DataFrame) -> None:
+    """Render the score distribution chart from ``_score_histogram`` rows."""
     st.markdown(
-        f"""<div style="margin: 1rem 0;">
-            <div style="font-size: 0.8rem; color: #94A3B8; margin-bottom: 0.5rem;">
-                Score Distribution / 分数分布
-            </div>
-            <div style="
-                display: flex;
-                justify-content: space-around;
-                align-items: flex-end;
-                padding: 0.5rem;
-                background: rgba(30, 41, 59, 0.3);
-                border-radius: 8px;
-            ">
-                {bars_html}
-            </div>
+        """<div style="font-size: 0.8rem; color: #94A3B8; margin: 1rem 0 0.5rem;">
+            Score Distribution / 分数分布
         </div>""",
         unsafe_allow_html=True,
     )
+    # Rendered client-side by Vega-Lite; sort=None keeps bins in score order
+    chart = (
+        alt.Chart(chart_data)
+        .mark_bar(color="#6366F1", cornerRadiusTopLeft=4, cornerRadiusTopRight=4)
+        .encode(
+            x=alt.X("bin:N", sort=None, title=None, axis=alt.Axis(labelAngle=0)),
+            y=alt.Y("count:Q", title=None, axis=alt.Axis(tickMinStep=1)),
+            tooltip=["bin", "count"],
+        )
+        .properties(height=140, padding={"bottom": 8})
+    )
+    st.altair_chart(chart, use_container_width=True)
+
+
+def _results_view(
+    task_id: str,
+    results: list[dict[str, Any]],
+    score_range: tuple[float, float],
+) -> tuple[pd.DataFrame, dict[str, Any], pd.DataFrame | None]:
+    """Get the results frame, derived summary and score histogram for the panel.
+
+    The view is kept in session state under a digest of the results, so
+    reruns that leave them unchanged skip the column extraction, summary and
+    binning work.
+    """
+    digest = _results_digest(results)
+    fingerprint = (digest, tuple(score_range))
+    state_key = f"{_VIEW_STATE_PREFIX}{task_id}"
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    frame = _results_frame(digest, results)
+    scores = _success_scores(frame)
+    view = (frame, _summarize_results(frame, scores), _score_histogram(scores, score_range))
+    st.session_state[state_key] = (fingerprint, view)
+    return view
+
+
+# Sort option -> (results frame column, descending)
+_SORT_OPTIONS: dict[str, tuple[str, bool]] = {
+    "Index ↑": ("index", False),
+    "Index ↓": ("index", True),
+    "Score ↑": ("score", False),
+    "Score ↓": ("score", True),
+}
+
+
+def _smallest_positions(keys: np.ndarray, k: int) -> np.ndarray:
+    """Get the positions of the ``k`` smallest keys, in stable-sort order.
+
+    Partitions around the k-th key instead of sorting everything, taking the
+    earliest positions among ties so the result matches a stable full sort.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < keys.size:
+        kth = np.partition(keys, k - 1)[k - 1]
+        below = np.flatnonzero(keys < kth)
+        ties = np.flatnonzero(keys == kth)[: k - below.size]
+        candidates = np.concatenate((below, ties))
+    else:
+        candidates = np.arange(keys.size)
+    return candidates[np.argsort(keys[candidates], kind="stable")]
+
+
+def _escape_block(text: str) -> str:
+    """Escape text for HTML, keeping newlines without emitting blank Markdown lines."""
+    return html.escape(text).replace("\n", "&#10;")
+
+
+# Result status -> (row CSS class, icon); row styles live in the app theme
+_ROW_STATUS_STYLES: dict[str, tuple[str, str]] = {
+    "error": ("row-err", "❌"),
+    "pass": ("row-pass", "✓"),
+    "fail": ("row-fail", "✗"),
+}
+
+# Result row markup; filled in per result by _row_html
+_ROW_HTML = """<div class="batch-result-row {css_class}">
+            <div class="batch-result-head">
+                <div class="batch-result-id">
+                    <span class="batch-result-index">#{number}</span>
+                    <span class="batch-result-icon">{icon}</span>
+                </div>
+                <div class="batch-result-score" style="color: {score_color};">{score_display}</div>
+            </div>
+            <details class="batch-result-details">
+                <summary>Details for #{number}</summary>
+                <div class="batch-result-body">{details}</div>
+            </details>
+        </div>"""
+
+
+def _row_html(result: dict[str, Any], score_range: tuple[float, float]) -> str:
+    """Build the HTML for one result row with its collapsible details."""
+    score = result.get("score")
+    reason = result.get("reason", "")
+    error = result.get("error", "")
+
+    if result.get("status") == "error":
+        css_class, icon = _ROW_STATUS_STYLES["error"]
+    elif result.get("passed"):
+        css_class, icon = _ROW_STATUS_STYLES["pass"]
+    else:
+        css_class, icon = _ROW_STATUS_STYLES["fail"]
+
+    # Expandable details
+    details = []
+    if error:
+        details.append(f'<div class="batch-result-error"><b>Error:</b> {_escape_block(str(error))}</div>')
+    if reason:
+        details.append(f'<div class="batch-result-reason"><b>Reason:</b> {_escape_block(str(reason))}</div>')
+    input_data = result.get("input", {})
+    if input_data:
+        input_json = _escape_block(json.dumps(input_data, ensure_ascii=False, indent=2, default=str))
+        details.append(f'<div class="batch-result-reason"><b>Input Data:</b></div><pre>{input_json}</pre>')
+
+    return _ROW_HTML.format(
+        css_class=css_class,
+        number=result.get("index", 0) + 1,
+        icon=icon,
+        score_color=_score_color(score, score_range[1]) if score is not None else "#64748B",
+        score_display=f"{score:.2f}" if score is not None else "--",
+        details="".join(details),
+    )
 
 
+@st.fragment
 def _render_results_table(
     results: list[dict[str, Any]],
+    frame: pd.DataFrame,
     score_range: tuple[float, float],
     task_id: str,
     page_size: int = 20,
 ) -> None:
-    """Render paginated results table."""
+    """Render paginated results table.
+
+    ``frame`` holds the filter/sort columns from ``_results_frame``. Runs as
+    a fragment, so filter, sort and page changes rerun only the table.
+    """
     if not results:
         return
 
@@ -222,32 +391,22 @@ def _render_results_table(
     with col_sort:
         sort_option = st.selectbox(
             "Sort / 排序",
-            options=["Index ↑", "Index ↓", "Score ↑", "Score ↓"],
+            options=list(_SORT_OPTIONS),
             key=f"batch_result_sort_{task_id}",
             label_visibility="collapsed",
         )
 
-    # Apply filters
-    filtered_results = results
+    # Apply filters as column masks
     if filter_option == "Passed":
-        filtered_results = [r for r in results if r.get("passed") is True]
+        frame = frame[frame["passed"].eq(True).fillna(False)]
     elif filter_option == "Failed":
-        filtered_results = [r for r in results if r.get("passed") is False and r.get("status") == "success"]
+        frame = frame[frame["passed"].eq(False).fillna(False) & frame["status"].eq("success")]
     elif filter_option == "Errors":
-        filtered_results = [r for r in results if r.get("status") == "error"]
-
-    # Apply sorting
-    if sort_option == "Index ↑":
-        filtered_results = sorted(filtered_results, key=lambda x: x.get("index", 0))
-    elif sort_option == "Index ↓":
-        filtered_results = sorted(filtered_results, key=lambda x: x.get("index", 0), reverse=True)
-    elif sort_option == "Score ↑":
-        filtered_results = sorted(filtered_results, key=lambda x: x.get("score") or 0)
-    elif sort_option == "Score ↓":
-        filtered_results = sorted(filtered_results, key=lambda x: x.get("score") or 0, reverse=True)
+        frame = frame[frame["status"].eq("error")]
+    filtered_count = len(frame)
 
     # Pagination
-    total_pages = (len(filtered_results) + page_size - 1) // page_size
+    total_pages = (filtered_count + page_size - 1) // page_size
     with col_page:
         current_page = st.number_input(
             "Page",
@@ -260,89 +419,35 @@ def _render_results_table(
 
     start_idx = (current_page - 1) * page_size
     end_idx = start_idx + page_size
-    page_results = filtered_results[start_idx:end_idx]
+
+    # Order only the rows up to this page (missing scores count as 0), then
+    # map the page back to its records
+    sort_column, descending = _SORT_OPTIONS[sort_option]
+    sort_keys = frame[sort_column].fillna(0).to_numpy(dtype=np.float64)
+    if descending:
+        sort_keys = -sort_keys
+    top = _smallest_positions(sort_keys, min(end_idx, sort_keys.size))
+    page_results = [results[pos] for pos in frame.index.to_numpy()[top[start_idx:]]]
 
     st.markdown(
         f"""<div style="font-size: 0.75rem; color: #64748B; margin-bottom: 0.5rem;">
-            Showing {start_idx + 1}-{min(end_idx, len(filtered_results))} of {len(filtered_results)} results
+            Showing {start_idx + 1}-{min(end_idx, filtered_count)} of {filtered_count} results
             (Page {current_page}/{total_pages})
         </div>""",
         unsafe_allow_html=True,
     )
 
-    # Render table
-    for result in page_results:
-        index = result.get("index", 0)
-        status = result.get("status", "unknown")
-        score = result.get("score")
-        passed = result.get("passed")
-        reason = result.get("reason", "")
-        error = result.get("error", "")
-
-        # Status styling
-        if status == "error":
-            status_bg = "rgba(239, 68, 68, 0.1)"
-            status_border = "#EF4444"
-            status_icon = "❌"
-        elif passed:
-            status_bg = "rgba(16, 185, 129, 0.1)"
-            status_border = "#10B981"
-            status_icon = "✓"
-        else:
-            status_bg = "rgba(245, 158, 11, 0.1)"
-            status_border = "#F59E0B"
-            status_icon = "✗"
-
-        score_display = f"{score:.2f}" if score is not None else "--"
-        score_color = get_score_color(score, score_range[1]) if score is not None else "#64748B"
-
-        with st.container():
-            st.markdown(
-                f"""<div style="
-                    background: {status_bg};
-                    border-left: 3px solid {status_border};
-                    border-radius: 0 8px 8px 0;
-                    padding: 0.75rem 1rem;
-                    margin-bottom: 0.5rem;
-                ">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div style="display: flex; align-items: center; gap: 0.75rem;">
-                            <span style="
-                                font-weight: 600;
-                                color: #F1F5F9;
-                                min-width: 3rem;
-                            ">#{index + 1}</span>
-                            <span style="color: {status_border}; font-size: 1rem;">{status_icon}</span>
-                        </div>
-                        <div style="
-                            font-size: 1.25rem;
-                            font-weight: 700;
-                            color: {score_color};
-                        ">{score_display}</div>
-                    </div>
-                </div>""",
-                unsafe_allow_html=True,
-            )
-
-            # Expandable details
-            with st.expander(f"Details for #{index + 1}", expanded=False):
-                if error:
-                    st.error(f"**Error:** {error}")
-                if reason:
-                    st.markdown(f"**Reason:** {reason}")
-
-                input_data = result.get("input", {})
-                if input_data:
-                    st.markdown("**Input Data:**")
-                    st.json(input_data)
+    # Render the whole page as a single HTML block
+    st.markdown("".join(_row_html(result, score_range) for result in page_results), unsafe_allow_html=True)
 
 
 def _render_export_buttons(task_id: str, history_manager: BatchHistoryManager) -> None:
     """Render export buttons."""
+    base_dir = str(history_manager.base_dir)
     col1, col2 = st.columns(2)
 
     with col1:
-        json_data = history_manager.export_results(task_id, "json")
+        json_data = _export_results(history_manager, base_dir, task_id, "json")
         if json_data:
             st.download_button(
                 label="📥 Export JSON",
@@ -354,7 +459,7 @@ def _render_export_buttons(task_id: str, history_manager: BatchHistoryManager) -
             )
 
     with col2:
-        csv_data = history_manager.export_results(task_id, "csv")
+        csv_data = _export_results(history_manager, base_dir, task_id, "csv")
         if csv_data:
             st.download_button(
                 label="📥 Export CSV",
@@ -390,39 +495,41 @@ def render_batch_result_panel(
 
     # Load from history if not provided
     if history_manager is None:
-        history_manager = BatchHistoryManager()
+        history_manager = get_batch_history_manager()
+    base_dir = str(history_manager.base_dir)
 
     if results is None:
-        results = history_manager.get_task_results(task_id) or []
+        results = _get_task_results(history_manager, base_dir, task_id)
+
+    # Columns shared by the summary, the distribution chart and the results table
+    frame, results_summary, chart_data = _results_view(task_id, results, score_range)
 
     if summary is None:
-        details = history_manager.get_task_details(task_id)
-        summary = details.get("summary", {}) if details else {}
+        # Loaded results already hold everything the summary cards show
+        if results:
+            summary = results_summary
+        else:
+            summary = _get_task_summary(history_manager, base_dir, task_id)
 
     # Summary cards
     _render_summary_cards(summary, score_range)
 
-    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
-
     # Score distribution
-    if results:
-        _render_score_distribution(results, score_range)
+    if chart_data is not None:
+        _render_score_distribution(chart_data)
 
     # Export buttons
-    st.markdown("<div style='height: 0.5rem;'></div>", unsafe_allow_html=True)
     _render_export_buttons(task_id, history_manager)
 
-    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
-
     # Results table
     if results:
         st.markdown(
-            """<div style="font-weight: 500; color: #94A3B8; margin-bottom: 0.5rem;">
+            """<div style="font-weight: 500; color: #94A3B8; margin: 1rem 0 0.5rem;">
                 Detailed Results / 详细结果
             </div>""",
             unsafe_allow_html=True,
         )
-        _render_results_table(results, score_range, task_id)
+        _render_results_table(results, frame, score_range, task_id)
 
 
 def render_empty_result_state() -> None:
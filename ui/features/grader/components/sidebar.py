@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Sidebar component for Grader feature."""
 
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
@@ -18,6 +19,19 @@ from shared.i18n import get_ui_language, t
 from openjudge.models.schema.prompt_template import LanguageEnum
 
 
+@lru_cache(maxsize=1)
+def _category_options() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Get the (category keys, category labels) for the category selector."""
+    categories = tuple(GRADER_CATEGORIES)
+    return categories, tuple(GRADER_CATEGORIES[cat]["name"] for cat in categories)
+
+
+@lru_cache(maxsize=None)
+def _grader_names(category: str) -> tuple[str, ...]:
+    """Get the names of the registered graders in a category."""
+    return tuple(get_graders_by_category(category))
+
+
 def _render_api_settings(config: dict[str, Any]) -> None:
     """Render API settings section."""
     st.markdown(f'<div class="section-header">{t("api.settings")}</div>', unsafe_allow_html=True)
@@ -100,8 +114,7 @@ def _render_grader_settings(config: dict[str, Any]) -> None:
     """Render grader settings section."""
     st.markdown(f'<div class="section-header">{t("grader.sidebar.grader")}</div>', unsafe_allow_html=True)
 
-    category_options = list(GRADER_CATEGORIES.keys())
-    category_labels = [GRADER_CATEGORIES[cat]["name"] for cat in category_options]
+    category_options, category_labels = _category_options()
 
     # Initialize category selection in session state
     if "grader_category_idx" not in st.session_state:
@@ -117,8 +130,7 @@ def _render_grader_settings(config: dict[str, Any]) -> None:
     selected_category = category_options[selected_category_idx]
     config["grader_category"] = selected_category
 
-    graders_in_category = get_graders_by_category(selected_category)
-    grader_names = list(graders_in_category.keys())
+    grader_names = _grader_names(selected_category)
 
     if grader_names:
         # Initialize grader selection in session state
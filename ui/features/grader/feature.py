@@ -9,6 +9,7 @@ from typing import Any
 import streamlit as st
 from core.base_feature import BaseFeature
 from features.grader.components.batch.batch_history_panel import (
+    clear_batch_history_cache,
     render_batch_history_panel,
     render_batch_task_detail,
 )
@@ -23,7 +24,7 @@ from features.grader.components.batch.upload_panel import render_upload_panel
 from features.grader.components.input_panel import render_input_panel_with_button
 from features.grader.components.result_panel import render_result_panel
 from features.grader.components.sidebar import render_grader_sidebar
-from features.grader.services.batch_history_manager import BatchHistoryManager
+from features.grader.services.batch_history_manager import get_batch_history_manager
 from features.grader.services.batch_runner import (
     BatchProgress,
     BatchRunner,
@@ -235,7 +236,7 @@ class GraderFeature(BaseFeature):
             return
 
         # Create history manager and generate task ID
-        history_manager = BatchHistoryManager()
+        history_manager = get_batch_history_manager()
         task_id = history_manager.generate_task_id()
 
         # Create API config
@@ -297,6 +298,7 @@ class GraderFeature(BaseFeature):
                     # Run evaluation
                     st.write(t("grader.batch.starting"))
                     progress = run_async(runner.run())
+                    clear_batch_history_cache()
 
                     # Clear progress placeholders
                     progress_text.empty()
@@ -403,6 +405,7 @@ class GraderFeature(BaseFeature):
         with st.status(f"🔄 {t('grader.batch.resuming_status')}", expanded=True) as status:
             try:
                 progress = run_async(runner.run())
+                clear_batch_history_cache()
 
                 st.session_state[self.STATE_BATCH_TASK_ID] = task_id
                 st.session_state[self.STATE_BATCH_PROGRESS] = progress
@@ -420,8 +423,8 @@ class GraderFeature(BaseFeature):
 
     def _on_delete_task(self, task_id: str) -> None:
         """Handle delete task button click."""
-        history_manager = BatchHistoryManager()
-        if history_manager.delete_task(task_id):
+        if get_batch_history_manager().delete_task(task_id):
+            clear_batch_history_cache()
             st.success(t("grader.batch.task_deleted", task_id=task_id))
             st.rerun()
         else:
@@ -4,6 +4,7 @@
 from features.grader.services.batch_history_manager import (
     BatchHistoryManager,
     BatchTaskSummary,
+    get_batch_history_manager,
 )
 from features.grader.services.batch_runner import (
     BatchProgress,
@@ -47,6 +48,7 @@ __all__ = [
     # Batch history manager
     "BatchHistoryManager",
     "BatchTaskSummary",
+    "get_batch_history_manager",
     # Batch runner
     "BatchRunner",
     "BatchProgress",
@@ -16,9 +16,10 @@ import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from loguru import logger
+from shared.utils.json_io import dump_json, load_json
 
 
 @dataclass
@@ -281,8 +282,7 @@ class BatchHistoryManager:
             return None
 
         try:
-            with open(results_path, "r", encoding="utf-8") as f:
-                all_results = json.load(f)
+            all_results = load_json(results_path)
 
             if not isinstance(all_results, list):
                 return None
@@ -311,8 +311,7 @@ class BatchHistoryManager:
             return None
 
         try:
-            with open(input_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(input_path)
         except Exception as e:
             logger.error(f"Failed to load input data for {task_id}: {e}")
             return None
@@ -354,8 +353,7 @@ class BatchHistoryManager:
             task_dir.mkdir(parents=True, exist_ok=True)
 
             input_path = task_dir / self.INPUT_DATA_FILE
-            with open(input_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            input_path.write_bytes(dump_json(data))
             return True
         except Exception as e:
             logger.error(f"Failed to save input data for {task_id}: {e}")
@@ -421,8 +419,7 @@ class BatchHistoryManager:
             task_dir = self.get_task_dir(task_id)
             results_path = task_dir / self.RESULTS_FILE
 
-            with open(results_path, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            results_path.write_bytes(dump_json(results))
             return True
         except Exception as e:
             logger.error(f"Failed to save results for {task_id}: {e}")
@@ -627,3 +624,19 @@ class BatchHistoryManager:
             logger.info(f"Cleaned up {deleted_count} old batch evaluation tasks")
 
         return deleted_count
+
+
+# Global batch history manager instance
+_batch_history_manager: Optional[BatchHistoryManager] = None
+
+
+def get_batch_history_manager() -> BatchHistoryManager:
+    """Get the global batch history manager instance.
+
+    Returns:
+        BatchHistoryManager instance for the default batch evaluation directory
+    """
+    global _batch_history_manager
+    if _batch_history_manager is None:
+        _batch_history_manager = BatchHistoryManager()
+    return _batch_history_manager
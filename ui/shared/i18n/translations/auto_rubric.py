@@ -61,6 +61,10 @@ EN: dict[str, str] = {
     "rubric.sidebar.advanced": "Advanced Settings",
     "rubric.sidebar.max_retries": "Max Retries",
     "rubric.sidebar.max_retries_help": "Maximum retry attempts for LLM API calls",
+    "rubric.sidebar.requests_per_minute": "Requests per Minute",
+    "rubric.sidebar.requests_per_minute_help": "Request rate limit for the API key. 0 means no limit",
+    "rubric.sidebar.tokens_per_minute": "Tokens per Minute",
+    "rubric.sidebar.tokens_per_minute_help": "Estimated token rate limit for the API key. 0 means no limit",
     # Config Panel - Simple Rubric
     "rubric.config.grader_name": "Grader Name",
     "rubric.config.grader_name_placeholder": "e.g., medical_qa_grader",
@@ -172,6 +176,8 @@ EN: dict[str, str] = {
     "rubric.history.delete_failed": "Failed to delete task",
     "rubric.history.back": "Back",
     "rubric.history.task_not_found": "Task not found",
+    "rubric.history.save_failed": "Failed to save to history: {error}",
+    "rubric.history.write_failed": "could not write task {task_id} to the history directory, see the log for details",
     # Validation
     "rubric.validation.name_required": "Grader name is required",
     "rubric.validation.task_required": "Task description is required",
@@ -241,6 +247,10 @@ ZH: dict[str, str] = {
     "rubric.sidebar.advanced": "高级设置",
     "rubric.sidebar.max_retries": "最大重试次数",
     "rubric.sidebar.max_retries_help": "LLM API 调用的最大重试次数",
+    "rubric.sidebar.requests_per_minute": "每分钟请求数",
+    "rubric.sidebar.requests_per_minute_help": "API Key 的请求速率限制，0 表示不限制",
+    "rubric.sidebar.tokens_per_minute": "每分钟 Token 数",
+    "rubric.sidebar.tokens_per_minute_help": "API Key 的估算 Token 速率限制，0 表示不限制",
     # Config Panel - Simple Rubric
     "rubric.config.grader_name": "Grader 名称",
     "rubric.config.grader_name_placeholder": "例如：medical_qa_grader",
@@ -350,6 +360,8 @@ ZH: dict[str, str] = {
     "rubric.history.delete_failed": "删除任务失败",
     "rubric.history.back": "返回",
     "rubric.history.task_not_found": "未找到任务",
+    "rubric.history.save_failed": "保存到历史记录失败：{error}",
+    "rubric.history.write_failed": "无法将任务 {task_id} 写入历史目录，详情请查看日志",
     # Validation
     "rubric.validation.name_required": "请输入 Grader 名称",
     "rubric.validation.task_required": "请输入任务描述",
@@ -920,6 +920,93 @@ iframe {
 [role="tabpanel"] {
     border: none !important;
 }
+
+/* =========================================================================
+   Batch Result Rows
+   ========================================================================= */
+.batch-result-row {
+    border-left: 3px solid #F59E0B;
+    border-radius: 0 8px 8px 0;
+    padding: 0.75rem 1rem;
+    margin-bottom: 0.5rem;
+    background: rgba(245, 158, 11, 0.1);
+    --row-accent: #F59E0B;
+}
+
+.batch-result-row.row-pass {
+    border-left-color: #10B981;
+    background: rgba(16, 185, 129, 0.1);
+    --row-accent: #10B981;
+}
+
+.batch-result-row.row-err {
+    border-left-color: #EF4444;
+    background: rgba(239, 68, 68, 0.1);
+    --row-accent: #EF4444;
+}
+
+.batch-result-head {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.batch-result-id {
+    display: flex;
+    align-items: center;
+    gap: 0.75rem;
+}
+
+.batch-result-index {
+    font-weight: 600;
+    color: #F1F5F9;
+    min-width: 3rem;
+}
+
+.batch-result-icon {
+    color: var(--row-accent);
+    font-size: 1rem;
+}
+
+.batch-result-score {
+    font-size: 1.25rem;
+    font-weight: 700;
+}
+
+.batch-result-details {
+    margin-top: 0.5rem;
+    font-size: 0.85rem;
+}
+
+.batch-result-details summary {
+    cursor: pointer;
+    color: #94A3B8;
+}
+
+.batch-result-body {
+    margin-top: 0.5rem;
+}
+
+.batch-result-error {
+    color: #FCA5A5;
+    background: rgba(239, 68, 68, 0.1);
+    border-radius: 6px;
+    padding: 0.5rem 0.75rem;
+    margin-bottom: 0.5rem;
+    white-space: pre-wrap;
+}
+
+.batch-result-reason {
+    color: #CBD5E1;
+    margin-bottom: 0.5rem;
+    white-space: pre-wrap;
+}
+
+.batch-result-body pre {
+    font-size: 0.75rem;
+    max-height: 20rem;
+    overflow: auto;
+}
 </style>
 """
 
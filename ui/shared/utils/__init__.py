@@ -6,21 +6,30 @@ from shared.utils.helpers import (
     encode_image_to_base64,
     format_elapsed_time,
     format_score_display,
+    get_background_loop,
     get_image_format,
     parse_json_safely,
     run_async,
+    submit_async,
     truncate_text,
     validate_api_key,
+    wait_async,
 )
+from shared.utils.json_io import dump_json, load_json
 
 __all__ = [
     "decode_base64_to_bytes",
+    "dump_json",
     "encode_image_to_base64",
     "format_elapsed_time",
     "format_score_display",
+    "get_background_loop",
     "get_image_format",
+    "load_json",
     "parse_json_safely",
     "run_async",
+    "submit_async",
     "truncate_text",
     "validate_api_key",
+    "wait_async",
 ]
@@ -4,10 +4,16 @@
 import asyncio
 import base64
 import json
-from typing import Any, Coroutine, TypeVar
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Shared event loop running in a daemon thread (see get_background_loop)
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """Run an async coroutine synchronously.
@@ -32,6 +38,59 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
         return asyncio.run(coro)
 
 
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, starting its daemon thread on first use.
+
+    Unlike run_async, which sets up and tears down a loop per call from a
+    Streamlit script thread, this loop lives for the whole process.
+
+    Returns:
+        The running background event loop
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="studio-event-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def submit_async(coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """Schedule a coroutine on the shared background event loop.
+
+    The coroutine runs outside the Streamlit script thread, so it must not
+    call Streamlit APIs directly; hand progress back through a queue instead.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        A concurrent future for the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+
+def wait_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared background event loop and wait for it.
+
+    If the waiting thread is interrupted, e.g. by a Streamlit rerun or stop,
+    the coroutine is cancelled instead of running on with no UI attached.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The result of the coroutine
+    """
+    future = submit_async(coro)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
 def parse_json_safely(json_str: str, default: Any = None) -> Any:
     """Parse JSON string safely, returning default on error.
 
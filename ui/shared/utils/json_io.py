@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""JSON serialization helpers for OpenJudge Studio.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so callers never import orjson themselves.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# Parse JSON from str or bytes; raises a json.JSONDecodeError subclass either way
+loads: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _numpy_default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays (e.g. in grader metadata) to Python values."""
+    if type(obj).__module__ == "numpy" and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(
+    obj: Any,
+    indent: bool = True,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes.
+
+    numpy scalars and arrays are written as plain numbers and lists. orjson
+    writes NaN and infinity as null.
+
+    Args:
+        obj: Object to serialize
+        indent: Indent with two spaces
+        sort_keys: Sort object keys
+        default: Fallback serializer for unsupported types
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default or _numpy_default,
+    ).encode("utf-8")
+
+
+def load_json(path: Path) -> Any:
+    """Read and parse a JSON file in one call.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Parsed JSON value
+    """
+    return loads(path.read_bytes())